@@ -2,9 +2,11 @@ import os
 import zipfile
 from io import BytesIO
 
+import polars as pl
+import polars_st as st
 import requests
 from osgeo import gdal
-from pyogrio import read_dataframe
+from pyogrio import read_arrow, read_dataframe
 from rusterize import rusterize
 
 # POLYGONS (~468MB)
@@ -20,6 +22,10 @@ if not os.path.exists("canvec_50K_BC_Hydro/waterbody_2.shp"):
 water_large = read_dataframe("canvec_50K_BC_Hydro/waterbody_2.shp")
 water_small = water_large.iloc[:1000, :]
 
+# pre-converted inputs, so conversion and extent inference stay out of the measured region
+water_large_polars = st.from_geopandas(water_large)
+water_large_like = rusterize(water_large, res=(1 / 6, 1 / 6), dtype="float64")
+
 
 # LINESTRINGS (~900 MB)
 if not os.path.exists("lrnf000r25p_e/lrnf000r25p_e.gpkg"):
@@ -30,6 +36,15 @@ if not os.path.exists("lrnf000r25p_e/lrnf000r25p_e.gpkg"):
 
 roads = read_dataframe("lrnf000r25p_e/lrnf000r25p_e.gpkg")
 
+# same layer through Arrow, skipping the pandas round trip
+_meta, _table = read_arrow("lrnf000r25p_e/lrnf000r25p_e.gpkg")
+roads_arrow = (
+    pl.from_arrow(_table)
+    .rename({_meta["geometry_name"] or "wkb_geometry": "geometry"})
+    # Arrow WKB carries no SRID, so the CRS is set to match the geopandas input
+    .with_columns(pl.col("geometry").st.set_srid(roads.crs.to_epsg()))
+)
+
 
 # Copy GDAL sources into in-memory datasets so feature decoding happens up front
 gdal.UseExceptions()
@@ -65,10 +80,18 @@ def test_water_small_f64_numpy(benchmark):
     benchmark(rusterize, water_small, res=(1 / 6, 1 / 6), dtype="float64", encoding="numpy")
 
 
+def test_water_large_polars_f64(benchmark):
+    benchmark(rusterize, water_large_polars, like=water_large_like, dtype="float64")
+
+
 def test_roads_uint8(benchmark):
     benchmark(rusterize, roads, res=(100, 100), dtype="uint8")
 
 
+def test_roads_arrow_uint8(benchmark):
+    benchmark(rusterize, roads_arrow, res=(100, 100), dtype="uint8")
+
+
 def test_water_large_gdal_f64(benchmark):
     benchmark(
         gdal.Rasterize,
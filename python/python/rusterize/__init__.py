@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import importlib.metadata
-from types import NoneType
-from typing import TYPE_CHECKING, Literal, overload
+import weakref
+from collections.abc import Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 import numpy as np
 
@@ -15,12 +16,215 @@ from ._dependencies import (
 from ._dependencies import geopandas as gpd
 from ._dependencies import polars as pl
 from ._dependencies import xarray as xr
-from ._rusterize import _rusterize
+from ._rusterize import RawRasterInfo, _rusterize, _rusterize_batch
+from ._validate import _BURN_TYPES, _RAW_TYPES, _check_args, _check_out, _resolve_user_raster
 
 if TYPE_CHECKING:
     from ._rusterize import SparseArray
 
-__version__ = importlib.metadata.version("rusterize")
+
+def __getattr__(name: str) -> Any:
+    # package metadata lookup walks site-packages, so defer it until `__version__` is requested
+    if name == "__version__":
+        import importlib.metadata
+
+        version = importlib.metadata.version("rusterize")
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# pyproj CRS -> EPSG code, keyed by object identity and dropped when the CRS is collected
+_EPSG_CACHE: dict[int, tuple[weakref.ref, int | None]] = {}
+
+
+def _crs_to_epsg(crs: Any) -> int | None:
+    """Memoized `crs.to_epsg()`, which queries the PROJ database on every call."""
+    key = id(crs)
+    hit = _EPSG_CACHE.get(key)
+    if hit is not None and hit[0]() is crs:
+        return hit[1]
+
+    epsg = crs.to_epsg()
+    try:
+        ref = weakref.ref(crs, lambda _, key=key: _EPSG_CACHE.pop(key, None))
+    except TypeError:
+        return epsg
+    _EPSG_CACHE[key] = (ref, epsg)
+    return epsg
+
+
+def _validate_args(
+    res: Any,
+    out_shape: Any,
+    extent: Any,
+    field: Any,
+    by: Any,
+    burn: Any,
+    fun: Any,
+    background: Any,
+    encoding: Any,
+    all_touched: Any,
+    tap: Any,
+    dtype: Any,
+) -> None:
+    """Validate the arguments shared by `rusterize` and `rusterize_batch`."""
+    _check_args(res, out_shape, extent, field, by, burn, fun, background, encoding, all_touched, tap, dtype)
+
+    if encoding == "xarray" and not _xarray_available():
+        raise ModuleNotFoundError(
+            "`xarray` and `rioxarray` must be installed if encoding is `xarray`. Install with `pip install xarray rioxarray`."
+        )
+
+    if field and burn is not None:
+        raise ValueError("Only one of `field` or `burn` can be specified.")
+
+
+def _spatial_shape(like: Any) -> tuple[int, int]:
+    """(nrows, ncols) of a template, read from its spatial dims without reshaping it."""
+    try:
+        return like.rio.shape
+    except Exception:
+        return like.sizes["y"], like.sizes["x"]
+
+
+def _resolve_like(like: Any, res: Any, out_shape: Any, extent: Any) -> tuple[tuple, tuple[int, int]]:
+    """Take (transform, shape) from a template xarray object."""
+    if not (_xarray_available() and isinstance(like, (xr.DataArray, xr.Dataset))):
+        raise TypeError("`like` must be a xarray.DataArray or xarray.Dataset")
+
+    if res is not None or out_shape is not None or extent is not None:
+        raise ValueError("`like` is mutually exclusive with `res`, `out_shape`, and `extent`.")
+
+    if not hasattr(like, "rio"):
+        raise AttributeError("The `like` object must have a 'rio' accessor.")
+
+    try:
+        # transform + shape fully determine the grid; the extent is derived from them in Rust
+        _shape = _spatial_shape(like)
+        transform = tuple(like.rio.transform())[:6]
+    except Exception as e:
+        raise AttributeError("No spatial dimension found for like object") from e
+
+    return transform, _shape
+
+
+def _resolve_grid(like: Any, res: Any, out_shape: Any, extent: Any, tap: bool) -> Callable[..., RawRasterInfo]:
+    """Resolve the output grid once. The returned factory only needs the EPSG code of the input."""
+    if like is not None:
+        transform, _shape = _resolve_like(like, res, out_shape, extent)
+        return partial(RawRasterInfo.from_transform, transform, _shape, tap=tap)
+
+    _res, _shape, _bounds = _resolve_user_raster(res, out_shape, extent)
+    return partial(RawRasterInfo, shape=_shape, extent=_bounds, resolution=_res, tap=tap)
+
+
+def _data_type(data: Any) -> str:
+    """Classify the input data, rejecting empty or unsupported inputs."""
+    if isinstance(data, _RAW_TYPES):
+        return "raw"
+
+    if _check_for_geopandas(data) and isinstance(data, gpd.GeoSeries):
+        if data.empty:
+            raise ValueError("Input data is empty.")
+        return "geoseries"
+
+    if _check_for_geopandas(data) and isinstance(data, gpd.GeoDataFrame):
+        if data.empty:
+            raise ValueError("Input data is empty.")
+        return "geopandas"
+
+    if _check_for_polars_st(data) and isinstance(data, pl.DataFrame):
+        if data.is_empty():
+            raise ValueError("Input data is empty.")
+        return "polars"
+
+    raise TypeError(
+        "`data` must be either geopandas.GeoDataFrame, geopandas.GeoSeries, polars.DataFrame, list, or numpy.ndarray"
+    )
+
+
+def _prepare_data(
+    data: Any, data_type: str, field: str | None, by: str | None, burn: Any, dtype: str
+) -> tuple[Any, Any, str | None, Any, int | None]:
+    """Extract (geometries, df, field, burn, epsg) from the input data."""
+    # extract columns of interest, if any. Burn-only calls skip column handling entirely
+    if field is None and by is None:
+        cols = ()
+    else:
+        cols = tuple(col for col in ((field,) if field == by else (field, by)) if col and col != "geometry")
+    df = None
+    epsg = None
+
+    # data-specific feature extraction
+    match data_type:
+        case "geopandas":
+            epsg = _crs_to_epsg(data.crs) if data.crs else None
+
+            if field in cols:
+                try:
+                    values = data[field]
+                except KeyError as e:
+                    raise KeyError("Column not found in GeoDataFrame.") from e
+
+                # numeric values are burned straight from numpy, leaving only `by` to polars
+                if not by or (isinstance(values.dtype, np.dtype) and values.dtype.kind in "biuf"):
+                    burn = values.to_numpy()
+                    field = None
+                    cols = (by,) if by in cols else ()
+
+            if cols:
+                if not _polars_available():
+                    raise ModuleNotFoundError("polars must be installed when data is geopandas.GeoDataFrame.")
+
+                try:
+                    columns = {col: data[col] for col in cols}
+                except KeyError as e:
+                    raise KeyError("Column not found in GeoDataFrame.") from e
+
+                # plain numpy columns skip the pandas -> arrow round trip
+                if all(isinstance(c.dtype, np.dtype) and c.dtype.kind in "biuf" for c in columns.values()):
+                    df = pl.DataFrame({col: c.to_numpy() for col, c in columns.items()})
+                else:
+                    df = pl.from_pandas(data[list(cols)])
+
+            geometries = data.geometry
+
+        case "polars":
+            # check if geometry has SRID. If 0, then None, else assume first SRID is equal for all geometries
+            try:
+                srid = data.select(pl.col("geometry").first().st.srid()).item()
+            except pl.exceptions.ColumnNotFoundError as e:
+                raise ValueError("If `polars.DataFrame`, a 'geometry' column is expected.") from e
+
+            epsg = None if srid == 0 else srid
+
+            # geometries are sent on their own, so `df` only carries the value columns across to Rust
+            if cols:
+                try:
+                    df = data.select(cols)
+                except pl.exceptions.ColumnNotFoundError as e:
+                    raise KeyError("Column not found in polars DataFrame.") from e
+
+            # geometries are extracted directly on the Rust side
+            geometries = data.get_column("geometry")
+
+        case "geoseries":
+            geometries = data.geometry
+            burn = burn if burn is not None else data.index.to_numpy()
+
+            if data.crs is not None:
+                epsg = _crs_to_epsg(data.crs)
+
+        case _:
+            # list or numpy.ndarray
+            geometries = data
+
+    # check that burn matches the output dtype
+    if isinstance(burn, np.ndarray) and burn.dtype != dtype:
+        burn = np.ascontiguousarray(burn, dtype=dtype)
+
+    return geometries, df, field, burn, epsg
 
 
 @overload
@@ -39,6 +243,7 @@ def rusterize(
     all_touched: bool = ...,
     tap: bool = ...,
     dtype: str = ...,
+    out: np.ndarray | None = ...,
 ) -> xr.DataArray: ...
 
 
@@ -58,6 +263,7 @@ def rusterize(
     all_touched: bool = ...,
     tap: bool = ...,
     dtype: str = ...,
+    out: np.ndarray | None = ...,
 ) -> np.ndarray: ...
 
 
@@ -95,6 +301,7 @@ def rusterize(
     all_touched: bool = False,
     tap: bool = False,
     dtype: str = "float64",
+    out: np.ndarray | None = None,
 ) -> xr.DataArray | np.ndarray | SparseArray:
     """
     Parameters
@@ -116,6 +323,7 @@ def rusterize(
         Column name to use for pixel values. Mutually exclusive with `burn`. Not considered when input is list or numpy.ndarray.
     by : `str` (default: None)
         Column used for grouping. Each group is rasterized into a distinct band in the output. Not considered when input is list or numpy.ndarray.
+        Requires polars when `data` is a geopandas.GeoDataFrame.
     burn : `int`, `float`, or `numpy.ndarray` (default: None)
         A static value or a list of values to apply to each geometries. If a `numpy.ndarray`, it must match the length of the geometry data. Mutually exclusive with `field`.
         If `burn` is a `numpy.ndarray`, its dtype should match the output `dtype`, otherwise it is internally casted. If `data` is a `geopandas.GeoSeries`, its index is used as `burn` value,
@@ -132,10 +340,13 @@ def rusterize(
         Target Aligned Pixels: aligns the extent to the pixel resolution.
     dtype : `str` (default: "float64")
         Output data type (e.g., `uint8`, `int32`, `float32`).
+    out : `numpy.ndarray` (default: None)
+        Pre-allocated array of shape (bands, nrows, ncols) and dtype `dtype` to burn into, instead of allocating a new one.
+        It is reset to `background` first, so it can be reused across calls (e.g. tiles on the same grid). Not supported for `sparse` encoding.
 
     Returns
     -------
-        xarray.DataArray, numpy.ndarray, or a sparse array in COO format.
+        xarray.DataArray, numpy.ndarray, or a sparse array in COO format. With `out`, the returned data is `out` itself.
 
     Notes
     ------
@@ -152,205 +363,134 @@ def rusterize(
     For example, a `background=np.nan` for `dtype="uint8"` will become `background=0`, where `0` is the default for `uint8`.
     """
 
-    if isinstance(data, (list, np.ndarray)):
-        data_type = "raw"
-    elif _check_for_geopandas(data) and isinstance(data, gpd.GeoSeries):
-        if data.empty:
-            raise ValueError("Input data is empty.")
-        data_type = "geoseries"
-    elif _check_for_geopandas(data) and isinstance(data, gpd.GeoDataFrame):
-        if data.empty:
-            raise ValueError("Input data is empty.")
-        data_type = "geopandas"
-    elif _check_for_polars_st(data) and isinstance(data, pl.DataFrame):
-        if data.is_empty():
-            raise ValueError("Input data is empty.")
-        data_type = "polars"
-    else:
-        raise TypeError(
-            "`data` must be either geopandas.GeoDataFrame, geopandas.GeoSeries, polars.DataFrame, list, or numpy.ndarray"
-        )
-
-    if not isinstance(res, (tuple, list, NoneType)):
-        raise TypeError("`resolution` must be a tuple or list of (xres, yres).")
-
-    if not isinstance(out_shape, (tuple, list, NoneType)):
-        raise TypeError("`out_shape` must be a tuple or list of (nrows, ncols).")
+    data_type = _data_type(data)
 
-    if not isinstance(extent, (tuple, list, NoneType)):
-        raise TypeError("`extent` must be a tuple or list of (xmin, ymin, xmax, ymax).")
-
-    if not isinstance(field, (str, NoneType)):
-        raise TypeError("`field` must be a string column name.")
-
-    if not isinstance(by, (str, NoneType)):
-        raise TypeError("`by` must be a string column name.")
-
-    if not isinstance(burn, (int, float, np.ndarray, NoneType)):
-        raise TypeError("`burn` must be an integer, float, or a numpy.ndarray.")
-
-    if not isinstance(fun, str):
-        raise TypeError("`pixel_fn` must be one of sum, first, last, min, max, count, or any.")
-
-    if not isinstance(background, (int, float, NoneType)):
-        raise TypeError("`background` must be integer, float, or None.")
-
-    if not isinstance(encoding, str):
-        raise TypeError("`encoding` must be one of 'xarray', 'numpy', or 'sparse'.")
-
-    if not isinstance(all_touched, bool):
-        raise TypeError("`all_touched` must be a boolean.")
-
-    if not isinstance(tap, bool):
-        raise TypeError("`tap` must be a boolean.")
-
-    if not isinstance(dtype, str):
-        raise TypeError(
-            "`dtype` must be a one of 'uint8', 'uint16', 'uint32', 'uint64', 'int8', 'int16', 'int32', 'int64', 'float32', 'float64'"
-        )
-
-    if encoding not in ["xarray", "numpy", "sparse"]:
-        raise ValueError("`encoding` must be one of `xarray`, 'numpy', or `sparse`.")
-
-    if encoding == "xarray" and not _xarray_available():
-        raise ModuleNotFoundError(
-            "`xarray` and `rioxarray` must be installed if encoding is `xarray`. Install with `pip install xarray rioxarray`."
-        )
-
-    if field and burn is not None:
-        raise ValueError("Only one of `field` or `burn` can be specified.")
+    _validate_args(res, out_shape, extent, field, by, burn, fun, background, encoding, all_touched, tap, dtype)
 
     if isinstance(burn, np.ndarray) and burn.size != len(data):
         raise ValueError("If `burn` is a `numpy.ndarray`, it must have the same length as `data`.")
 
-    _bounds = None
-    _res = None
-    _shape = None
-
-    if like is not None:
-        if not (_xarray_available() and isinstance(like, (xr.DataArray, xr.Dataset))):
-            raise TypeError("`like` must be a xarray.DataArray or xarray.Dataset")
-
-        if any((res, out_shape, extent)):
-            raise ValueError("`like` is mutually exclusive with `res`, `out_shape`, and `extent`.")
-
-        if not hasattr(like, "rio"):
-            raise AttributeError("The `like` object must have a 'rio' accessor.")
+    if out is not None:
+        _check_out(out, encoding, dtype)
 
-        try:
-            # extent + shape fully determines resolution; passing res too trips the shape/res mutex
-            _shape = like.squeeze().shape
-            _bounds = like.rio.bounds()
-        except Exception as e:
-            raise AttributeError("No spatial dimension found for like object") from e
-    else:
-        if not res and not out_shape and not extent:
-            raise ValueError("One of `res`, `out_shape`, or `extent` must be provided.")
+    make_raster_info = _resolve_grid(like, res, out_shape, extent, tap)
 
-        if res and out_shape:
-            raise ValueError("`res` and `out_shape` are mutually exclusive; provide only one.")
+    geometries, df, field, burn, epsg = _prepare_data(data, data_type, field, by, burn, dtype)
 
-        if extent:
-            if not res and not out_shape:
-                raise ValueError("Must also specify `res` or `out_shape` with extent.")
+    raw_raster_info = make_raster_info(epsg=epsg)
 
-            if len(extent) != 4 or all(e == 0 for e in extent):
-                raise ValueError("`extent` must be a tuple or list of (xmin, ymin, xmax, ymax).")
-            _bounds = extent
-
-        if res:
-            if len(res) != 2 or any(r <= 0 for r in res) or any(not isinstance(r, (int, float)) for r in res):
-                raise ValueError("`res` must be 2 positive numbers.")
-            _res = res
-
-        if out_shape:
-            if len(out_shape) != 2 or any(s <= 0 for s in out_shape) or any(not isinstance(s, int) for s in out_shape):
-                raise ValueError("`out_shape` must be 2 positive integers.")
-            _shape = out_shape
+    return _rusterize(
+        geometries,
+        raw_raster_info,
+        fun,
+        df,
+        field,
+        by,
+        burn,
+        background,
+        all_touched,
+        encoding,
+        dtype,
+        out,
+    )
 
-    # extract columns of interest, if any
-    cols = list(set([col for col in (field, by) if col and col != "geometry"]))
-    df = None
-    epsg = None
 
-    # data-specific feature extraction
-    match data_type:
-        case "geopandas":
-            epsg = data.crs.to_epsg() if data.crs else None
+def rusterize_batch(
+    datas: list | tuple,
+    like: xr.DataArray | xr.Dataset | None = None,
+    res: tuple | list | None = None,
+    out_shape: tuple | list | None = None,
+    extent: tuple | list | None = None,
+    field: str | None = None,
+    by: str | None = None,
+    burn: int | float | list | tuple | None = None,
+    fun: str = "last",
+    background: int | float | None = np.nan,
+    encoding: str = "xarray",
+    all_touched: bool = False,
+    tap: bool = False,
+    dtype: str = "float64",
+    out: list | tuple | None = None,
+) -> list[xr.DataArray | np.ndarray | SparseArray]:
+    """
+    Rasterize several inputs onto the same grid in a single call.
 
-            if cols:
-                if field and not by:
-                    # optimization for a single column
-                    try:
-                        burn = data[field].to_numpy()
-                        field = None
-                    except KeyError as e:
-                        raise KeyError("Column not found in GeoDataFrame.") from e
-                else:
-                    if not _polars_available():
-                        raise ModuleNotFoundError("polars must be installed when data is geopandas.GeoDataFrame.")
+    Parameters
+    ----------
+    datas : list or tuple
+        Inputs to rasterize, each accepted by `rusterize`. Inputs can be of different types.
+    like, res, out_shape, extent : see `rusterize`
+        The grid must be fixed, so either `like` or `extent` is required.
+    field, by, fun, background, encoding, all_touched, tap, dtype : see `rusterize`
+        Applied to every input.
+    burn : `int`, `float`, `list`, or `tuple` (default: None)
+        A static value to apply to every input, or one `burn` value per input as accepted by `rusterize`.
+    out : `list` or `tuple` (default: None)
+        One pre-allocated array (or None) per input, as accepted by `rusterize`. Not supported for `sparse` encoding.
 
-                    try:
-                        df = pl.from_pandas(data[cols])
-                    except KeyError as e:
-                        raise KeyError("Column not found in GeoDataFrame.") from e
+    Returns
+    -------
+        A list with one output per input, in the same order.
 
-            geometries = data.geometry
+    Notes
+    ------
+    Arguments and the output grid are validated once for the whole batch. Inputs are then burned in parallel
+    in Rust, which makes this cheaper than calling `rusterize` in a loop over many small inputs, e.g. tiles
+    sharing the same extent.
+    """
+    if not isinstance(datas, (list, tuple)):
+        raise TypeError("`datas` must be a list or tuple of inputs.")
 
-        case "polars":
-            # check if geometry has SRID. If 0, then None, else assume first SRID is equal for all geometries
-            try:
-                srid = data.select(pl.col("geometry").first().st.srid()).item()
-            except pl.exceptions.ColumnNotFoundError as e:
-                raise ValueError("If `polars.DataFrame`, a 'geometry' column is expected.") from e
+    if like is None and extent is None:
+        raise ValueError("A fixed grid is required: provide `like` or `extent`.")
 
-            epsg = None if srid == 0 else srid
+    burns = burn if isinstance(burn, (list, tuple)) else [burn] * len(datas)
+    if len(burns) != len(datas):
+        raise ValueError("If `burn` is a list or tuple, it must have one value per input.")
 
-            if cols:
-                try:
-                    df = data.select(pl.col([*cols, "geometry"]))
-                except pl.exceptions.ColumnNotFoundError as e:
-                    raise KeyError("Column not found in polars DataFrame.") from e
+    if out is not None and (not isinstance(out, (list, tuple)) or len(out) != len(datas)):
+        raise ValueError("`out` must be a list or tuple with one array (or None) per input.")
 
-            # geometries are extracted directly on the Rust side
-            geometries = data.select(pl.col("geometry")).to_series()
+    # `burn` is checked per input below
+    _validate_args(res, out_shape, extent, field, by, None, fun, background, encoding, all_touched, tap, dtype)
 
-        case "geoseries":
-            geometries = data.geometry
-            burn = burn if burn is not None else data.index.to_numpy()
+    for b in burns:
+        if not isinstance(b, _BURN_TYPES):
+            raise TypeError("`burn` must be an integer, float, or a numpy.ndarray.")
+        if field and b is not None:
+            raise ValueError("Only one of `field` or `burn` can be specified.")
 
-            try:
-                epsg = data.crs.to_epsg()
-            except AttributeError:
-                pass
+    make_raster_info = _resolve_grid(like, res, out_shape, extent, tap)
 
-        case _:
-            # list or numpy.ndarray
-            geometries = data
+    geometries, raw_raster_infos, dfs, fields, prepared_burns = [], [], [], [], []
+    for data, b in zip(datas, burns):
+        data_type = _data_type(data)
+        if isinstance(b, np.ndarray) and b.size != len(data):
+            raise ValueError("If `burn` is a `numpy.ndarray`, it must have the same length as `data`.")
 
-    # check that burn matches the output dtype
-    if isinstance(burn, np.ndarray) and burn.dtype != dtype:
-        burn = np.ascontiguousarray(burn, dtype=dtype)
+        _geometries, df, _field, _burn, epsg = _prepare_data(data, data_type, field, by, b, dtype)
+        geometries.append(_geometries)
+        raw_raster_infos.append(make_raster_info(epsg=epsg))
+        dfs.append(df)
+        fields.append(_field)
+        prepared_burns.append(_burn)
 
-    # RawRasterInfo
-    raw_raster_info = {
-        "shape": _shape,
-        "extent": _bounds,
-        "resolution": _res,
-        "tap": tap,
-        "epsg": epsg,
-    }
+    if out is not None:
+        for o in out:
+            if o is not None:
+                _check_out(o, encoding, dtype)
 
-    return _rusterize(
+    return _rusterize_batch(
         geometries,
-        raw_raster_info,
+        raw_raster_infos,
         fun,
-        df,
-        field,
+        dfs,
+        fields,
         by,
-        burn,
+        prepared_burns,
         background,
         all_touched,
         encoding,
         dtype,
+        out,
     )
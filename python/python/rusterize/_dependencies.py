@@ -13,6 +13,9 @@ class _Missing:
         self._name = name
 
     def __getattr__(self, attr: str) -> Any:
+        # introspection (hasattr, pickle, inspect) probes dunders and expects an AttributeError
+        if attr[:2] == "__" == attr[-2:]:
+            raise AttributeError(attr)
         raise ModuleNotFoundError(f"{attr} requires the {self._name!r} module to be installed.")
 
 
@@ -62,10 +65,7 @@ def _polars_available() -> bool:
 @cache
 def _might_be(cls: type, type_: str) -> bool:
     """Infer if a class hierarchy contains a specific module name."""
-    try:
-        return any(f"{type_}." in str(o) for o in cls.mro())
-    except TypeError:
-        return False
+    return any((getattr(c, "__module__", None) or "").partition(".")[0] == type_ for c in getattr(cls, "__mro__", ()))
 
 
 def _check_for_geopandas(obj: Any) -> bool:
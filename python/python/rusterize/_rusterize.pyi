@@ -7,7 +7,7 @@ from ._dependencies import xarray as xr
 
 def _rusterize(
     geometry: Any,
-    raw_raster_info: dict[str, Any],
+    raw_raster_info: RawRasterInfo,
     pypixel_fn: str,
     pydf: Any | None = None,
     pyfield: str | None = None,
@@ -17,9 +17,42 @@ def _rusterize(
     pytouched: bool = False,
     pyencoding: str = "xarray",
     pydtype: str = "float64",
+    pyout: np.ndarray | None = None,
 ) -> xr.DataArray | np.ndarray | SparseArray: ...
+def _rusterize_batch(
+    geometries: list[Any],
+    raw_raster_infos: list[RawRasterInfo],
+    pypixel_fn: str,
+    pydfs: list[Any | None],
+    pyfields: list[str | None],
+    pyby: str | None = None,
+    pyburns: list[Any | None] | None = None,
+    pybackground: Any | None = None,
+    pytouched: bool = False,
+    pyencoding: str = "xarray",
+    pydtype: str = "float64",
+    pyouts: list[np.ndarray | None] | None = None,
+) -> list[xr.DataArray | np.ndarray | SparseArray]: ...
+
+class RawRasterInfo:
+    def __init__(
+        self,
+        shape: tuple[int, int] | list[int] | None = None,
+        extent: tuple[float, float, float, float] | list[float] | None = None,
+        resolution: tuple[float, float] | list[float] | None = None,
+        tap: bool = False,
+        epsg: int | None = None,
+    ) -> None: ...
+    @staticmethod
+    def from_transform(
+        transform: tuple[float, float, float, float, float, float],
+        shape: tuple[int, int],
+        epsg: int | None = None,
+        tap: bool = False,
+    ) -> RawRasterInfo: ...
 
 class SparseArray:
     def to_xarray(self) -> xr.DataArray: ...
     def to_numpy(self) -> np.ndarray: ...
     def to_frame(self) -> pl.DataFrame: ...
+    def __arrow_c_stream__(self, requested_schema: object | None = None) -> object: ...
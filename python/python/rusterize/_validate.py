@@ -0,0 +1,138 @@
+"""Argument validation that does not depend on the input data or on optional dependencies."""
+
+from __future__ import annotations
+
+from types import NoneType
+from typing import Any
+
+import numpy as np
+
+# argument types, built once at import instead of on every call
+_RAW_TYPES = (list, np.ndarray)
+_SEQ_OR_NONE = (tuple, list, NoneType)
+_STR_OR_NONE = (str, NoneType)
+_NUMBER = (int, float)
+_BURN_TYPES = (int, float, np.ndarray, NoneType)
+_BACKGROUND_TYPES = (int, float, NoneType)
+_ENCODINGS = frozenset(("xarray", "numpy", "sparse"))
+_PIXEL_FUNCTIONS = frozenset(("sum", "first", "last", "min", "max", "count", "any"))
+_DTYPES = frozenset(
+    ("uint8", "uint16", "uint32", "uint64", "int8", "int16", "int32", "int64", "float32", "float64")
+)
+
+_PIXEL_FN_MESSAGE = "`pixel_fn` must be one of sum, first, last, min, max, count, or any."
+_DTYPE_MESSAGE = "`dtype` must be a one of 'uint8', 'uint16', 'uint32', 'uint64', 'int8', 'int16', 'int32', 'int64', 'float32', 'float64'"
+
+
+def _check_args(
+    res: Any,
+    out_shape: Any,
+    extent: Any,
+    field: Any,
+    by: Any,
+    burn: Any,
+    fun: Any,
+    background: Any,
+    encoding: Any,
+    all_touched: Any,
+    tap: Any,
+    dtype: Any,
+) -> None:
+    """Type and value checks that do not depend on the input data or on optional dependencies."""
+    if not isinstance(res, _SEQ_OR_NONE):
+        raise TypeError("`resolution` must be a tuple or list of (xres, yres).")
+
+    if not isinstance(out_shape, _SEQ_OR_NONE):
+        raise TypeError("`out_shape` must be a tuple or list of (nrows, ncols).")
+
+    if not isinstance(extent, _SEQ_OR_NONE):
+        raise TypeError("`extent` must be a tuple or list of (xmin, ymin, xmax, ymax).")
+
+    if not isinstance(field, _STR_OR_NONE):
+        raise TypeError("`field` must be a string column name.")
+
+    if not isinstance(by, _STR_OR_NONE):
+        raise TypeError("`by` must be a string column name.")
+
+    if not isinstance(burn, _BURN_TYPES):
+        raise TypeError("`burn` must be an integer, float, or a numpy.ndarray.")
+
+    if not isinstance(fun, str):
+        raise TypeError(_PIXEL_FN_MESSAGE)
+
+    if not isinstance(background, _BACKGROUND_TYPES):
+        raise TypeError("`background` must be integer, float, or None.")
+
+    if not isinstance(encoding, str):
+        raise TypeError("`encoding` must be one of 'xarray', 'numpy', or 'sparse'.")
+
+    if not isinstance(all_touched, bool):
+        raise TypeError("`all_touched` must be a boolean.")
+
+    if not isinstance(tap, bool):
+        raise TypeError("`tap` must be a boolean.")
+
+    if not isinstance(dtype, str):
+        raise TypeError(_DTYPE_MESSAGE)
+
+    if fun not in _PIXEL_FUNCTIONS:
+        raise ValueError(_PIXEL_FN_MESSAGE)
+
+    if dtype not in _DTYPES:
+        raise ValueError(_DTYPE_MESSAGE)
+
+    if encoding not in _ENCODINGS:
+        raise ValueError("`encoding` must be one of `xarray`, 'numpy', or `sparse`.")
+
+
+def _check_out(out: Any, encoding: str, dtype: str) -> None:
+    """Checks for a user-provided output array, whose shape is only known once the grid is built."""
+    if encoding == "sparse":
+        raise ValueError("`out` is not supported when encoding is `sparse`.")
+
+    if not isinstance(out, np.ndarray) or out.ndim != 3:
+        raise TypeError("`out` must be a 3D numpy.ndarray of (bands, nrows, ncols).")
+
+    if out.dtype != dtype:
+        raise ValueError("`out` must have the same dtype as `dtype`.")
+
+    if not out.flags.writeable:
+        raise ValueError("`out` must be writeable.")
+
+
+def _is_positive_pair(values: tuple | list, types: type | tuple[type, ...]) -> bool:
+    """Whether `values` holds exactly 2 positive numbers of `types`, checked in a single pass."""
+    return len(values) == 2 and all(isinstance(v, types) and v > 0 for v in values)
+
+
+def _resolve_user_raster(res: Any, out_shape: Any, extent: Any) -> tuple[Any, Any, Any]:
+    """Validate user-provided (res, shape, bounds)."""
+    _bounds = None
+    _res = None
+    _shape = None
+
+    if res is None and out_shape is None and extent is None:
+        raise ValueError("One of `res`, `out_shape`, or `extent` must be provided.")
+
+    if res is not None and out_shape is not None:
+        raise ValueError("`res` and `out_shape` are mutually exclusive; provide only one.")
+
+    if extent is not None:
+        if res is None and out_shape is None:
+            raise ValueError("Must also specify `res` or `out_shape` with extent.")
+
+        if len(extent) != 4 or all(e == 0 for e in extent):
+            raise ValueError("`extent` must be a tuple or list of (xmin, ymin, xmax, ymax).")
+        _bounds = extent
+
+    if res is not None:
+        if not _is_positive_pair(res, _NUMBER):
+            raise ValueError("`res` must be 2 positive numbers.")
+        _res = res
+
+    if out_shape is not None:
+        if not _is_positive_pair(out_shape, int):
+            raise ValueError("`out_shape` must be 2 positive integers.")
+        _shape = out_shape
+
+    return _res, _shape, _bounds
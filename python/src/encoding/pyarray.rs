@@ -1,4 +1,4 @@
-use pyo3::prelude::*;
+use pyo3::{intern, prelude::*};
 use pyo3_polars::PyDataFrame;
 use std::sync::Arc;
 
@@ -137,4 +137,16 @@ impl PySparseArray {
     fn to_frame(&self) -> PyDataFrame {
         self.0.to_frame()
     }
+
+    /// Arrow PyCapsule stream of the frame returned by `to_frame`, so Arrow-aware libraries can ingest
+    /// the sparse output without a dense intermediate.
+    #[pyo3(signature = (requested_schema=None))]
+    fn __arrow_c_stream__<'py>(
+        &self,
+        py: Python<'py>,
+        requested_schema: Option<Bound<'py, PyAny>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let frame = self.0.to_frame().into_pyobject(py)?;
+        frame.call_method1(intern!(py, "__arrow_c_stream__"), (requested_schema,))
+    }
 }
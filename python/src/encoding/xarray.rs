@@ -21,37 +21,26 @@ where
 
     let (y, x) = make_coordinates(py, raster_info);
     let bands = PyList::new(py, band_names)?;
-    let dims = PyList::new(py, vec!["bands", "y", "x"])?;
 
-    // dimensions
-    let dim_x = PyDict::new(py);
-    dim_x.set_item("dims", "x")?;
-    dim_x.set_item("data", x)?;
-
-    let dim_y = PyDict::new(py);
-    dim_y.set_item("dims", "y")?;
-    dim_y.set_item("data", y)?;
-
-    let dim_bands = PyDict::new(py);
-    dim_bands.set_item("dims", "bands")?;
-    dim_bands.set_item("data", bands)?;
-
-    // coordinates
+    // coordinates, passed straight to the constructor to avoid `DataArray.from_dict` parsing
     let coords = PyDict::new(py);
-    coords.set_item("x", dim_x)?;
-    coords.set_item("y", dim_y)?;
-    coords.set_item("bands", dim_bands)?;
+    coords.set_item("bands", bands)?;
+    coords.set_item("y", y)?;
+    coords.set_item("x", x)?;
 
-    // xarray dict
-    let dict = PyDict::new(py);
-    dict.set_item("data", data)?;
-    dict.set_item("dims", dims)?;
-    dict.set_item("coords", coords)?;
+    let kwargs = PyDict::new(py);
+    kwargs.set_item("coords", coords)?;
+    kwargs.set_item("dims", ("bands", "y", "x"))?;
 
-    let mut result = xarray_module.getattr("DataArray")?.call_method1("from_dict", (dict,))?;
+    let result = xarray_module.getattr("DataArray")?.call((data,), Some(&kwargs))?;
 
+    // in place, otherwise rioxarray deep-copies the whole raster
     if let Some(epsg) = raster_info.epsg {
-        result = result.getattr("rio")?.call_method1("write_crs", (epsg,))?;
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("inplace", true)?;
+        result
+            .getattr("rio")?
+            .call_method("write_crs", (epsg,), Some(&kwargs))?;
     };
 
     Ok(result)
@@ -1,16 +1,20 @@
 use geo_traits::to_geo::ToGeoGeometry;
-use geo_types::Geometry;
+use geo_types::{Coord, Geometry, LineString, MultiLineString, MultiPoint, MultiPolygon, Point, Polygon};
+use numpy::{PyReadonlyArray1, PyReadonlyArray2, ndarray::ArrayView2};
 use polars::{datatypes::DataType, prelude::*};
 use pyo3::{
     Bound,
-    exceptions::{PyTypeError, PyValueError},
+    exceptions::{PyNotImplementedError, PyTypeError, PyValueError},
     intern,
     prelude::*,
-    pybacked::PyBackedBytes,
-    types::{PyAny, PyBytes, PyDict, PyList, PyString},
+    pybacked::{PyBackedBytes, PyBackedStr},
+    types::{PyAny, PyBytes, PyDict, PyList, PyString, PyTuple},
 };
 use pyo3_polars::PySeries;
-use rayon::iter::ParallelIterator;
+use rayon::{
+    iter::{IntoParallelIterator, IntoParallelRefIterator, ParallelIterator},
+    slice::ParallelSlice,
+};
 use rusterize::prelude::{RusterizeError, RusterizeResult};
 use wkb::reader::read_wkb;
 use wkt::TryFromWkt;
@@ -39,8 +43,7 @@ impl FromPyObject<'_, '_> for ParsedGeometry {
     fn extract(obj: Borrowed<'_, '_, PyAny>) -> PyResult<Self> {
         // geopandas.GeoDataFrame or GeoSeries
         if obj.hasattr("geom_type")? {
-            let wkb_result = to_wkb(&obj)?;
-            return parse_sequence_wkb(&wkb_result);
+            return parse_shapely(&obj);
         }
 
         if obj.is_instance_of::<PyList>() || obj.get_type().name()? == "ndarray" {
@@ -56,8 +59,7 @@ impl FromPyObject<'_, '_> for ParsedGeometry {
                 return parse_sequence_wkt(&obj);
             } else if first.hasattr("geom_type")? {
                 // list of shapely geometries
-                let wkb_result = to_wkb(&obj)?;
-                return parse_sequence_wkb(&wkb_result);
+                return parse_shapely(&obj);
             } else {
                 return Err(PyValueError::new_err(
                     "Sequence must contain geometries as shapely Geometry, bytes (WKB), or string (WKT).",
@@ -106,28 +108,167 @@ fn to_wkb<'a>(input: &Bound<'a, PyAny>) -> PyResult<Bound<'a, PyAny>> {
     shapely_mod.call_method(intern!(py, "to_wkb"), args, Some(&kwargs))
 }
 
-fn parse_sequence_wkb(input: &Bound<PyAny>) -> PyResult<ParsedGeometry> {
-    let mut geoms = Vec::with_capacity(input.len()?);
-    for item in input.try_iter()? {
-        let buf = item?.extract::<PyBackedBytes>()?;
-        if let Some(parsed) = try_parse_wkb_to_geometry(&buf) {
-            geoms.push(parsed);
+/// Parse shapely geometries. Single-type inputs are handed over as GeoArrow buffers in one call,
+/// everything else (mixed types, geometry collections) falls back to WKB.
+fn parse_shapely(input: &Bound<PyAny>) -> PyResult<ParsedGeometry> {
+    if let Some(parsed) = try_parse_ragged_array(input)? {
+        return Ok(parsed);
+    }
+
+    let wkb_result = to_wkb(input)?;
+    parse_sequence_wkb(&wkb_result)
+}
+
+/// Build geometries from the coordinates and offsets returned by `shapely.to_ragged_array`.
+/// Returns `None` if the input cannot be represented as GeoArrow. Missing (`None`) geometries are
+/// encoded by shapely as empty geometries, so they are kept in place and burn no pixels.
+fn try_parse_ragged_array(input: &Bound<PyAny>) -> PyResult<Option<ParsedGeometry>> {
+    let py = input.py();
+    let shapely_mod = py.import(intern!(py, "shapely"))?;
+
+    let kwargs = PyDict::new(py);
+    kwargs.set_item("include_z", false)?;
+
+    let ragged = match shapely_mod.call_method(intern!(py, "to_ragged_array"), (input,), Some(&kwargs)) {
+        Ok(ragged) => ragged,
+        // unsupported geometry types or type combinations, which are left to the WKB path
+        Err(e) if e.is_instance_of::<PyValueError>(py) || e.is_instance_of::<PyNotImplementedError>(py) => {
+            return Ok(None);
         }
+        Err(e) => return Err(e),
+    };
+
+    let (geom_type, coords, pyoffsets): (i32, PyReadonlyArray2<f64>, Bound<PyTuple>) = ragged.extract()?;
+    let offsets = pyoffsets
+        .iter()
+        .map(|o| extract_offsets(&o))
+        .collect::<PyResult<Vec<Vec<usize>>>>()?;
+    let coords = coords.as_array();
+
+    // shapely.GeometryType codes
+    let geoms = match (geom_type, offsets.as_slice()) {
+        (0, []) => (0..coords.nrows())
+            .into_par_iter()
+            .map(|i| Geometry::Point(Point(coord_at(&coords, i))))
+            .collect(),
+        (1, [geom_offsets]) => geom_offsets
+            .par_windows(2)
+            .map(|w| Geometry::LineString(line_string(&coords, w[0], w[1])))
+            .collect(),
+        (3, [ring_offsets, geom_offsets]) => geom_offsets
+            .par_windows(2)
+            .map(|w| Geometry::Polygon(polygon(&coords, ring_offsets, w[0], w[1])))
+            .collect(),
+        (4, [geom_offsets]) => geom_offsets
+            .par_windows(2)
+            .map(|w| Geometry::MultiPoint(MultiPoint((w[0]..w[1]).map(|i| Point(coord_at(&coords, i))).collect())))
+            .collect(),
+        (5, [line_offsets, geom_offsets]) => geom_offsets
+            .par_windows(2)
+            .map(|w| {
+                Geometry::MultiLineString(MultiLineString(
+                    (w[0]..w[1])
+                        .map(|l| line_string(&coords, line_offsets[l], line_offsets[l + 1]))
+                        .collect(),
+                ))
+            })
+            .collect(),
+        (6, [ring_offsets, polygon_offsets, geom_offsets]) => geom_offsets
+            .par_windows(2)
+            .map(|w| {
+                Geometry::MultiPolygon(MultiPolygon(
+                    (w[0]..w[1])
+                        .map(|p| polygon(&coords, ring_offsets, polygon_offsets[p], polygon_offsets[p + 1]))
+                        .collect(),
+                ))
+            })
+            .collect(),
+        _ => return Ok(None),
+    };
+
+    Ok(Some(ParsedGeometry(geoms)))
+}
+
+/// Offsets may come as int32 or int64 depending on the platform.
+fn extract_offsets(obj: &Bound<PyAny>) -> PyResult<Vec<usize>> {
+    if let Ok(arr) = obj.extract::<PyReadonlyArray1<i64>>() {
+        return Ok(arr.as_array().iter().map(|&o| o as usize).collect());
     }
+    let arr = obj.extract::<PyReadonlyArray1<i32>>()?;
+    Ok(arr.as_array().iter().map(|&o| o as usize).collect())
+}
 
-    bail_if_empty_geoms!(geoms);
-    Ok(ParsedGeometry(geoms))
+#[inline]
+fn coord_at(coords: &ArrayView2<f64>, i: usize) -> Coord<f64> {
+    Coord {
+        x: coords[[i, 0]],
+        y: coords[[i, 1]],
+    }
 }
 
-fn parse_sequence_wkt(input: &Bound<'_, PyAny>) -> PyResult<ParsedGeometry> {
-    let mut geoms = Vec::with_capacity(input.len().unwrap_or(0));
-    for item in input.try_iter()? {
-        let s = item?.extract::<String>()?;
-        if let Some(parsed) = try_parse_wkt_to_geometry(&s) {
-            geoms.push(parsed);
+fn line_string(coords: &ArrayView2<f64>, start: usize, end: usize) -> LineString<f64> {
+    LineString::new((start..end).map(|i| coord_at(coords, i)).collect())
+}
+
+/// Polygon made of rings `start..end`, where the first ring is the exterior.
+fn polygon(coords: &ArrayView2<f64>, ring_offsets: &[usize], start: usize, end: usize) -> Polygon<f64> {
+    if start == end {
+        return Polygon::new(LineString::new(Vec::new()), Vec::new());
+    }
+
+    let exterior = line_string(coords, ring_offsets[start], ring_offsets[start + 1]);
+    let interiors = (start + 1..end)
+        .map(|r| line_string(coords, ring_offsets[r], ring_offsets[r + 1]))
+        .collect();
+    Polygon::new(exterior, interiors)
+}
+
+fn parse_sequence_wkb(input: &Bound<PyAny>) -> PyResult<ParsedGeometry> {
+    // numpy object arrays of `bytes` (e.g. from `shapely.to_wkb`) are read in place, borrowing each object.
+    // Any other buffer type (bytearray, memoryview) goes through the generic path below
+    if let Ok(arr) = input.extract::<PyReadonlyArray1<Py<PyAny>>>()
+        && let Ok(items) = arr.as_slice()
+    {
+        let py = input.py();
+        let buffers = items
+            .iter()
+            .map(|item| item.bind(py).cast::<PyBytes>().ok().map(|b| b.as_bytes()))
+            .collect::<Option<Vec<&[u8]>>>();
+
+        if let Some(buffers) = buffers {
+            return collect_parsed(buffers.into_par_iter().filter_map(try_parse_wkb_to_geometry).collect());
         }
     }
 
+    let buffers = input
+        .try_iter()?
+        .map(|item| item?.extract::<PyBackedBytes>())
+        .collect::<PyResult<Vec<PyBackedBytes>>>()?;
+
+    collect_parsed(
+        buffers
+            .par_iter()
+            .filter_map(|buf| try_parse_wkb_to_geometry(buf))
+            .collect(),
+    )
+}
+
+fn parse_sequence_wkt(input: &Bound<'_, PyAny>) -> PyResult<ParsedGeometry> {
+    let strings = input
+        .try_iter()?
+        .map(|item| item?.extract::<PyBackedStr>())
+        .collect::<PyResult<Vec<PyBackedStr>>>()?;
+
+    collect_parsed(
+        strings
+            .par_iter()
+            .filter_map(|s| try_parse_wkt_to_geometry(s))
+            .collect(),
+    )
+}
+
+/// Geometries are decoded in parallel once the raw buffers have been gathered under the GIL.
+fn collect_parsed(geoms: Vec<Geometry<f64>>) -> PyResult<ParsedGeometry> {
     bail_if_empty_geoms!(geoms);
     Ok(ParsedGeometry(geoms))
 }
@@ -137,6 +278,8 @@ fn parse_polars_series(input: Series) -> RusterizeResult<ParsedGeometry> {
         DataType::Binary => input
             .binary()?
             .iter()
+            .collect::<Vec<Option<&[u8]>>>()
+            .into_par_iter()
             .filter_map(|item| item.and_then(try_parse_wkb_to_geometry))
             .collect(),
         DataType::String => input
@@ -1,10 +1,10 @@
 use geo::Geometry;
 use numpy::{IntoPyArray, PyArray1, ndarray::Array};
-use pyo3::prelude::*;
+use pyo3::{exceptions::PyValueError, prelude::*};
 use rusterize::prelude::{RasterInfo, RasterInfoBuilder, RusterizeResult};
 
-#[derive(FromPyObject)]
-#[pyo3(from_item_all)]
+/// Spatial information of the output raster, as received from Python.
+#[pyclass(frozen)]
 pub struct RawRasterInfo {
     shape: Option<[usize; 2]>,
     extent: Option<[f64; 4]>,
@@ -13,8 +13,51 @@ pub struct RawRasterInfo {
     epsg: Option<u16>,
 }
 
+#[pymethods]
 impl RawRasterInfo {
-    pub(crate) fn build(self, geoms: &[Geometry<f64>]) -> RusterizeResult<RasterInfo> {
+    #[new]
+    #[pyo3(signature = (shape=None, extent=None, resolution=None, tap=false, epsg=None))]
+    fn new(
+        shape: Option<[usize; 2]>,
+        extent: Option<[f64; 4]>,
+        resolution: Option<[f64; 2]>,
+        tap: bool,
+        epsg: Option<u16>,
+    ) -> Self {
+        Self {
+            shape,
+            extent,
+            resolution,
+            tap,
+            epsg,
+        }
+    }
+
+    /// Grid taken from an affine transform `(a, b, c, d, e, f)` and `(nrows, ncols)`, e.g. from `rio.transform()`.
+    #[staticmethod]
+    #[pyo3(signature = (transform, shape, epsg=None, tap=false))]
+    fn from_transform(transform: [f64; 6], shape: [usize; 2], epsg: Option<u16>, tap: bool) -> PyResult<Self> {
+        let [a, b, c, d, e, f] = transform;
+        if b != 0.0 || d != 0.0 {
+            return Err(PyValueError::new_err("Rotated transforms are not supported."));
+        }
+
+        let [nrows, ncols] = shape;
+        let (x0, x1) = (c, c + a * ncols as f64);
+        let (y0, y1) = (f, f + e * nrows as f64);
+
+        Ok(Self {
+            shape: Some(shape),
+            extent: Some([x0.min(x1), y0.min(y1), x0.max(x1), y0.max(y1)]),
+            resolution: None,
+            tap,
+            epsg,
+        })
+    }
+}
+
+impl RawRasterInfo {
+    pub(crate) fn build(&self, geoms: &[Geometry<f64>]) -> RusterizeResult<RasterInfo> {
         let mut builder = RasterInfoBuilder::new();
 
         if let Some(shape) = self.shape {
@@ -41,21 +84,22 @@ impl RawRasterInfo {
     }
 }
 
-/// Construct coordinates for xarray (start from pixel's center)
+/// Construct coordinates for xarray (start from pixel's center).
+/// `linspace` guarantees exactly `nrows`/`ncols` values, where a float `range` step can be off by one.
 pub(crate) fn make_coordinates<'py>(
     py: Python<'py>,
     info: &RasterInfo,
 ) -> (Bound<'py, PyArray1<f64>>, Bound<'py, PyArray1<f64>>) {
-    let y_coords = Array::range(
+    let y_coords = Array::linspace(
         info.ymax - info.yres / 2.0,
-        info.ymax - info.nrows as f64 * info.yres,
-        -info.yres,
+        info.ymax - (info.nrows as f64 - 0.5) * info.yres,
+        info.nrows,
     )
     .into_pyarray(py);
-    let x_coords = Array::range(
+    let x_coords = Array::linspace(
         info.xmin + info.xres / 2.0,
-        info.xmin + info.ncols as f64 * info.xres,
-        info.xres,
+        info.xmin + (info.ncols as f64 - 0.5) * info.xres,
+        info.ncols,
     )
     .into_pyarray(py);
     (y_coords, x_coords)
@@ -5,7 +5,7 @@ mod geo {
 }
 mod encoding {
     pub(crate) mod pyarray;
-    mod xarray;
+    pub(crate) mod xarray;
 }
 mod prelude;
 mod rusterize;
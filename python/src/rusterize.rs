@@ -1,10 +1,13 @@
 use crate::{
-    encoding::pyarray::{PyOutput, Pythonize},
+    encoding::{
+        pyarray::{PyOutput, Pythonize},
+        xarray::build_xarray,
+    },
     geo::{parse_geometry::ParsedGeometry, raster::RawRasterInfo},
     prelude::*,
 };
-use num_traits::One;
-use numpy::{Element, PyReadonlyArray1};
+use num_traits::{Num, One};
+use numpy::{Element, PyArray3, PyArrayMethods, PyReadonlyArray1};
 use polars::prelude::*;
 use pyo3::{
     conversion::FromPyObject,
@@ -13,17 +16,35 @@ use pyo3::{
     types::PyAny,
 };
 use pyo3_polars::PyDataFrame;
+use rayon::iter::{IndexedParallelIterator, IntoParallelIterator, IntoParallelRefIterator, ParallelIterator};
 use rusterize::prelude::*;
 
 macro_rules! dispatch_rusterize {
+    ($impl_fn:ident, $dtype:expr, $encoding:expr, $py:expr, $ctx:expr) => {
+        dispatch_rusterize!(
+            @match $impl_fn, $dtype, $encoding, $py, $ctx,
+            [
+                ("uint8", u8),
+                ("uint16", u16),
+                ("uint32", u32),
+                ("uint64", u64),
+                ("int8", i8),
+                ("int16", i16),
+                ("int32", i32),
+                ("int64", i64),
+                ("float32", f32),
+                ("float64", f64)
+            ]
+        )
+    };
     (
-        $dtype:expr, $encoding:expr, $py:expr, $ctx:expr,
+        @match $impl_fn:ident, $dtype:expr, $encoding:expr, $py:expr, $ctx:expr,
         [ $( ($str_val:pat, $rust_type:ty) ),* ]
     ) => {
         match ($dtype, $encoding) {
             $(
-                ($str_val, "xarray" | "numpy") => rusterize_py_impl::<DenseArray<$rust_type>>($py, $ctx),
-                ($str_val, "sparse") => rusterize_py_impl::<SparseArray<$rust_type>>($py, $ctx),
+                ($str_val, "xarray" | "numpy") => $impl_fn::<DenseArray<$rust_type>>($py, $ctx),
+                ($str_val, "sparse") => $impl_fn::<SparseArray<$rust_type>>($py, $ctx),
             )*
             _ => unimplemented!("Invalid dtype or encoding provided."),
         }
@@ -39,26 +60,56 @@ struct Context<'py> {
     pyfield: Option<&'py str>,
     pyby: Option<&'py str>,
     pyburn: Option<&'py Bound<'py, PyAny>>,
+    pyout: Option<&'py Bound<'py, PyAny>>,
     opt_flags: OptionalFlags,
 }
 
-fn rusterize_py_impl<'py, A>(py: Python<'py>, ctx: Context<'py>) -> PyResult<PyOutput<'py>>
+struct BatchContext<'py> {
+    geometries: Vec<ParsedGeometry>,
+    raster_infos: Vec<RasterInfo>,
+    pixel_fn: PixelFunction,
+    pybackground: Option<&'py Bound<'py, PyAny>>,
+    dfs: Vec<Option<DataFrame>>,
+    pyfields: Vec<Option<String>>,
+    pyby: Option<&'py str>,
+    pyburns: Vec<Option<Bound<'py, PyAny>>>,
+    pyouts: Vec<Option<Bound<'py, PyAny>>>,
+    opt_flags: OptionalFlags,
+}
+
+/// Values to burn, extracted under the GIL so that burning can run without it.
+enum FieldValues<'py, N: Element> {
+    Scalar(N),
+    Array(PyReadonlyArray1<'py, N>),
+    Column(Column),
+}
+
+impl<N: Element + Copy> FieldValues<'_, N> {
+    fn as_source(&self) -> FieldSource<'_, N> {
+        match self {
+            Self::Scalar(value) => FieldSource::Scalar(*value),
+            Self::Array(arr) => FieldSource::Array(arr.as_array()),
+            Self::Column(column) => FieldSource::Column(column.clone()),
+        }
+    }
+}
+
+fn extract_values<'py, N>(
+    df: Option<&DataFrame>,
+    pyfield: Option<&str>,
+    pyby: Option<&str>,
+    pyburn: Option<&Bound<'py, PyAny>>,
+) -> PyResult<(FieldValues<'py, N>, Option<Vec<String>>)>
 where
-    A: ArrayBuilder + Pythonize,
-    A::Dtype: Default + Element + for<'a> FromPyObject<'a, 'py>,
+    N: RasterDtype + Element + for<'a> FromPyObject<'a, 'py>,
 {
-    let background = ctx
-        .pybackground
-        .and_then(|inner| inner.extract().ok())
-        .unwrap_or_default();
-
-    let prepared = match &ctx.df {
+    let prepared = match df {
         Some(df) => {
             let mut exprs: Vec<Expr> = Vec::new();
-            if let Some(field) = ctx.pyfield {
-                exprs.push(col(field).cast(<A::Dtype>::polars_dtype()).alias("field"));
+            if let Some(field) = pyfield {
+                exprs.push(col(field).cast(N::polars_dtype()).alias("field"));
             }
-            if let Some(by) = ctx.pyby {
+            if let Some(by) = pyby {
                 exprs.push(col(by).cast(DataType::String).alias("by"));
             }
             Some(
@@ -72,24 +123,19 @@ where
         _ => None,
     };
 
-    let arr: PyReadonlyArray1<A::Dtype>;
-
-    let field = match (&prepared, ctx.pyfield) {
-        (Some(df), Some(_)) => FieldSource::Column(df.column("field").unwrap().clone()),
-        _ => match ctx.pyburn {
-            None => FieldSource::Scalar(<A::Dtype>::one()),
-            Some(b) => match b.extract::<A::Dtype>() {
-                Ok(scalar) => FieldSource::Scalar(scalar),
-                Err(_) => {
-                    arr = b.extract::<PyReadonlyArray1<A::Dtype>>()?;
-                    FieldSource::Array(arr.as_array())
-                }
+    let field = match (&prepared, pyfield) {
+        (Some(df), Some(_)) => FieldValues::Column(df.column("field").unwrap().clone()),
+        _ => match pyburn {
+            None => FieldValues::Scalar(N::one()),
+            Some(b) => match b.extract::<N>() {
+                Ok(scalar) => FieldValues::Scalar(scalar),
+                Err(_) => FieldValues::Array(b.extract::<PyReadonlyArray1<N>>()?),
             },
         },
     };
 
     // force every geometry to have a corresponding by value, errors if nulls
-    let by = match (&prepared, ctx.pyby) {
+    let by = match (&prepared, pyby) {
         (Some(df), Some(_)) => {
             let ca = df.column("by").unwrap().str().unwrap();
 
@@ -109,29 +155,174 @@ where
         _ => None,
     };
 
+    Ok((field, by))
+}
+
+/// Map core errors to Python, where a `ValueError` is a caller error such as a mismatched `out`.
+fn to_pyerr(e: RusterizeError) -> PyErr {
+    match e {
+        RusterizeError::ValueError(msg) => PyValueError::new_err(msg),
+        e => PyRuntimeError::new_err(e.to_string()),
+    }
+}
+
+/// Wrap an `out` array that was burned in place.
+fn wrap_out<'py, N: Num + Element>(
+    py: Python<'py>,
+    out: &Bound<'py, PyArray3<N>>,
+    raster_info: &RasterInfo,
+    band_names: &[String],
+    opt_flags: OptionalFlags,
+) -> PyResult<PyOutput<'py>> {
+    let output = if opt_flags.xarray {
+        build_xarray(py, raster_info, out.clone(), band_names)?
+    } else {
+        out.clone().into_any()
+    };
+    Ok(PyOutput::Dense(output))
+}
+
+fn rusterize_py_impl<'py, A>(py: Python<'py>, ctx: Context<'py>) -> PyResult<PyOutput<'py>>
+where
+    A: ArrayBuilder + Pythonize + Send,
+    A::Dtype: Default + Element + for<'a> FromPyObject<'a, 'py>,
+{
+    let background = ctx
+        .pybackground
+        .and_then(|inner| inner.extract().ok())
+        .unwrap_or_default();
+
+    let (values, by) = extract_values::<A::Dtype>(ctx.df.as_ref(), ctx.pyfield, ctx.pyby, ctx.pyburn)?;
+
     let rctx = RasterizeContext {
         raster_info: ctx.raster_info,
-        field,
+        field: values.as_source(),
         by: by.as_deref(),
         pixel_fn: ctx.pixel_fn,
         background,
         all_touched: ctx.opt_flags.all_touched,
     };
 
-    ctx.geometry
-        .rasterize::<A>(rctx)
+    // burning touches no Python objects, so other Python threads can run meanwhile
+    let geometry = &ctx.geometry;
+
+    // burn onto the user-provided array in place, skipping the allocation of a new raster
+    if let Some(pyout) = ctx.pyout {
+        let out = pyout.cast::<PyArray3<A::Dtype>>()?;
+        let raster_info = rctx.raster_info.clone();
+
+        // the core checks the shape of `out`, which is a caller error rather than a runtime failure
+        let band_names = {
+            let mut rw = out.try_readwrite()?;
+            let view = rw.as_array_mut();
+            py.detach(|| geometry.rasterize_into(rctx, view)).map_err(to_pyerr)?
+        };
+
+        return wrap_out(py, out, &raster_info, &band_names, ctx.opt_flags);
+    }
+
+    py.detach(|| geometry.rasterize::<A>(rctx))
         .map_err(|e| PyRuntimeError::new_err(e.to_string()))?
         .pythonize(py, ctx.opt_flags)
 }
 
+/// Result of burning one input of a batch, before it is handed back to Python.
+enum Burned<A> {
+    New(A),
+    Into(Vec<String>),
+}
+
+fn rusterize_batch_impl<'py, A>(py: Python<'py>, ctx: BatchContext<'py>) -> PyResult<Vec<PyOutput<'py>>>
+where
+    A: ArrayBuilder + Pythonize + Send,
+    A::Dtype: Default + Element + for<'a> FromPyObject<'a, 'py>,
+{
+    let background = ctx
+        .pybackground
+        .and_then(|inner| inner.extract().ok())
+        .unwrap_or_default();
+
+    // everything that touches Python is gathered first, input by input
+    let values = ctx
+        .dfs
+        .iter()
+        .zip(&ctx.pyfields)
+        .zip(&ctx.pyburns)
+        .map(|((df, pyfield), pyburn)| {
+            extract_values::<A::Dtype>(df.as_ref(), pyfield.as_deref(), ctx.pyby, pyburn.as_ref())
+        })
+        .collect::<PyResult<Vec<_>>>()?;
+
+    let outs = ctx
+        .pyouts
+        .iter()
+        .map(|pyout| -> PyResult<_> {
+            match pyout {
+                Some(o) => Ok(Some(o.cast::<PyArray3<A::Dtype>>()?)),
+                None => Ok(None),
+            }
+        })
+        .collect::<PyResult<Vec<_>>>()?;
+
+    // the same array passed twice fails to borrow here rather than being burned concurrently
+    let mut rws = outs
+        .iter()
+        .map(|out| out.as_ref().map(|o| o.try_readwrite()).transpose())
+        .collect::<Result<Vec<_>, _>>()?;
+
+    let jobs = ctx
+        .raster_infos
+        .iter()
+        .zip(&values)
+        .zip(rws.iter_mut())
+        .map(|((raster_info, (field, by)), rw)| {
+            let rctx = RasterizeContext {
+                raster_info: raster_info.clone(),
+                field: field.as_source(),
+                by: by.as_deref(),
+                pixel_fn: ctx.pixel_fn.clone(),
+                background,
+                all_touched: ctx.opt_flags.all_touched,
+            };
+            (rctx, rw.as_mut().map(|rw| rw.as_array_mut()))
+        })
+        .collect::<Vec<_>>();
+
+    // inputs are burned in parallel, without the GIL
+    let geometries = &ctx.geometries;
+    let burned = py
+        .detach(|| {
+            jobs.into_par_iter()
+                .zip(geometries.par_iter())
+                .map(|((rctx, view), geometry)| match view {
+                    Some(view) => geometry.rasterize_into(rctx, view).map(Burned::Into),
+                    None => geometry.rasterize::<A>(rctx).map(Burned::New),
+                })
+                .collect::<RusterizeResult<Vec<_>>>()
+        })
+        .map_err(to_pyerr)?;
+    drop(rws);
+
+    burned
+        .into_iter()
+        .zip(&outs)
+        .zip(&ctx.raster_infos)
+        .map(|((burned, out), raster_info)| match (burned, out) {
+            (Burned::Into(band_names), Some(out)) => wrap_out(py, out, raster_info, &band_names, ctx.opt_flags),
+            (Burned::New(array), _) => array.pythonize(py, ctx.opt_flags),
+            (Burned::Into(_), None) => unreachable!("in-place burns always have an `out` array"),
+        })
+        .collect()
+}
+
 #[pyfunction]
 #[pyo3(name = "_rusterize")]
-#[pyo3(signature = (geometry, raw_raster_info, pypixel_fn, pydf=None, pyfield=None, pyby=None, pyburn=None, pybackground=None, pytouched=false, pyencoding="xarray", pydtype="float64"))]
+#[pyo3(signature = (geometry, raw_raster_info, pypixel_fn, pydf=None, pyfield=None, pyby=None, pyburn=None, pybackground=None, pytouched=false, pyencoding="xarray", pydtype="float64", pyout=None))]
 #[allow(clippy::too_many_arguments)]
 fn rusterize_py<'py>(
     py: Python<'py>,
     geometry: ParsedGeometry,
-    raw_raster_info: RawRasterInfo,
+    raw_raster_info: PyRef<'py, RawRasterInfo>,
     pypixel_fn: &'py str,
     pydf: Option<PyDataFrame>,
     pyfield: Option<&'py str>,
@@ -141,6 +332,7 @@ fn rusterize_py<'py>(
     pytouched: bool,
     pyencoding: &str,
     pydtype: &str,
+    pyout: Option<&'py Bound<PyAny>>,
 ) -> PyResult<PyOutput<'py>> {
     let df: Option<DataFrame> = pydf.map(|inner| inner.into());
     let raster_info = raw_raster_info
@@ -160,32 +352,74 @@ fn rusterize_py<'py>(
         pyfield,
         pyby,
         pyburn,
+        pyout,
+        opt_flags,
+    };
+
+    dispatch_rusterize!(rusterize_py_impl, pydtype, pyencoding, py, ctx)
+}
+
+#[pyfunction]
+#[pyo3(name = "_rusterize_batch")]
+#[pyo3(signature = (geometries, raw_raster_infos, pypixel_fn, pydfs, pyfields, pyby=None, pyburns=None, pybackground=None, pytouched=false, pyencoding="xarray", pydtype="float64", pyouts=None))]
+#[allow(clippy::too_many_arguments)]
+fn rusterize_batch_py<'py>(
+    py: Python<'py>,
+    geometries: Vec<ParsedGeometry>,
+    raw_raster_infos: Vec<PyRef<'py, RawRasterInfo>>,
+    pypixel_fn: &'py str,
+    pydfs: Vec<Option<PyDataFrame>>,
+    pyfields: Vec<Option<String>>,
+    pyby: Option<&'py str>,
+    pyburns: Option<Vec<Option<Bound<'py, PyAny>>>>,
+    pybackground: Option<&'py Bound<PyAny>>,
+    pytouched: bool,
+    pyencoding: &str,
+    pydtype: &str,
+    pyouts: Option<Vec<Option<Bound<'py, PyAny>>>>,
+) -> PyResult<Vec<PyOutput<'py>>> {
+    let n = geometries.len();
+    if [raw_raster_infos.len(), pydfs.len(), pyfields.len()] != [n; 3]
+        || pyburns.as_ref().is_some_and(|b| b.len() != n)
+        || pyouts.as_ref().is_some_and(|o| o.len() != n)
+    {
+        return Err(PyValueError::new_err(
+            "Every batched argument must have one entry per input.",
+        ));
+    }
+
+    let raster_infos = raw_raster_infos
+        .iter()
+        .zip(&geometries)
+        .map(|(raw, geometry)| raw.build(geometry.as_ref()))
+        .collect::<RusterizeResult<Vec<_>>>()
+        .map_err(|e| PyRuntimeError::new_err(e.to_string()))?;
+    let pixel_fn = pypixel_fn
+        .parse::<PixelFunction>()
+        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+    let opt_flags = OptionalFlags::new(pytouched, pyencoding);
+
+    let ctx = BatchContext {
+        geometries,
+        raster_infos,
+        pixel_fn,
+        pybackground,
+        dfs: pydfs.into_iter().map(|df| df.map(|inner| inner.into())).collect(),
+        pyfields,
+        pyby,
+        pyburns: pyburns.unwrap_or_else(|| vec![None; n]),
+        pyouts: pyouts.unwrap_or_else(|| vec![None; n]),
         opt_flags,
     };
 
-    dispatch_rusterize!(
-        pydtype,
-        pyencoding,
-        py,
-        ctx,
-        [
-            ("uint8", u8),
-            ("uint16", u16),
-            ("uint32", u32),
-            ("uint64", u64),
-            ("int8", i8),
-            ("int16", i16),
-            ("int32", i32),
-            ("int64", i64),
-            ("float32", f32),
-            ("float64", f64)
-        ]
-    )
+    dispatch_rusterize!(rusterize_batch_impl, pydtype, pyencoding, py, ctx)
 }
 
 #[pymodule]
 #[pyo3(name = "_rusterize")]
 fn rusterize_wrap(m: &Bound<PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(rusterize_py, m)?)?;
+    m.add_function(wrap_pyfunction!(rusterize_batch_py, m)?)?;
+    m.add_class::<RawRasterInfo>()?;
     Ok(())
 }
@@ -1,17 +1,20 @@
 from osgeo import gdal
 
-import os
 import re
-import warnings
-from tempfile import NamedTemporaryFile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
 from unittest.mock import patch
 
 import geopandas as gpd
 import numpy as np
+import polars as pl
 import polars_st as st
+import pyogrio
 import pytest
+import shapely
 import xarray as xr
-from rusterize import rusterize
+from rusterize import rusterize, rusterize_batch
 from shapely import wkt
 
 gdal.UseExceptions()
@@ -27,42 +30,147 @@ GEOMS = [
 geometries = [wkt.loads(geom) for geom in GEOMS]
 GDF = gpd.GeoDataFrame({"value": range(1, len(GEOMS) + 1)}, geometry=geometries)
 
+# the same geometries in the other supported input formats, serialized once
+WKB_NP = shapely.to_wkb(geometries)
+WKB_LIST = WKB_NP.tolist()
+PLST = st.GeoDataFrame({"value": list(range(1, len(GEOMS) + 1)), "geometry": GEOMS})
+PLST_WKB = PLST.st.to_wkb()
+
+# single-type inputs, which shapely hands over as GeoArrow buffers instead of WKB
+SINGLE_TYPE_GEOMS = {
+    "polygon_with_hole": [GEOMS[0], GEOMS[1]],
+    "multipolygon": [
+        "MULTIPOLYGON (((-180 -20, -140 55, -60 0, -180 -20)), ((10 -60, 60 10, 120 -30, 10 -60), (40 -40, 60 -20, 80 -35, 40 -40)))",
+        "MULTIPOLYGON (((100 20, 100 60, 170 60, 170 20, 100 20)))",
+    ],
+    "polygon_and_multipolygon": [
+        GEOMS[2],
+        "MULTIPOLYGON (((75 -40, 75 -30, 100 -30, 100 -40, 75 -40)), ((100 20, 100 30, 110 30, 110 20, 100 20)))",
+    ],
+    "multilinestring": [GEOMS[3], "MULTILINESTRING ((-150 40, 150 40), (0 -60, 0 60))"],
+    "points": ["POINT (50 -40)", "POINT (-100.5 20.5)", "POINT (120 45)", "POINT (50 -40)"],
+}
+
+# custom grid shared by the TestCustomRaster cases
+EXTENT = (-349, -507, 1, 0)
+SHAPE = (47, 319)  # (height, width)
+
+# (extent, shape, all_touched) grids compared against GDAL, with res=(1, 1) when shape is None
+CUSTOM_GRIDS = [
+    (EXTENT, None, False),
+    (EXTENT, None, True),
+    (None, SHAPE, True),
+    # extent + shape, since GDAL does not directly support res + shape as input parameters
+    (EXTENT, SHAPE, False),
+    (EXTENT, SHAPE, True),
+]
+
+# GDAL struggles with nested collections, so we explode all of them to be safe
+parts, parts_idx = shapely.get_parts(np.asarray(GDF.geometry), return_index=True)
+parts, nested_idx = shapely.get_parts(parts, return_index=True)
+EXPLODED_GDF = gpd.GeoDataFrame({"value": GDF["value"].to_numpy()[parts_idx[nested_idx]]}, geometry=parts)
+
+
+def _read_only(array):
+    """Freeze a reference array shared across tests, so that no test can alter it for the others"""
+    array.flags.writeable = False
+    return array
+
+
+@pytest.fixture(scope="session")
+def like_xarr():
+    """Template DataArray on the default 1x1 grid"""
+    return rusterize(GDF, res=(1, 1), dtype="uint8", field="value", encoding="xarray")
+
 
 @pytest.fixture(scope="module")
 def exploded_gpkg():
-    """Temporary GPKG with exploded geometries for GDAL"""
-    with NamedTemporaryFile(suffix=".gpkg", delete=False) as tmp:
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            # GDAL struggles with nested collections, so we explode all of them to be safe
-            GDF.explode().explode().to_file(tmp.name, driver="GPKG", layer="test")
-        path = tmp.name
+    """In-memory GPKG with exploded geometries for GDAL"""
+    # pyogrio bundles its own GDAL, whose /vsimem is not shared with osgeo, so the bytes are handed over explicitly
+    buffer = BytesIO()
+    pyogrio.write_dataframe(EXPLODED_GDF, buffer, driver="GPKG", layer="test")
+
+    path = "/vsimem/exploded.gpkg"
+    gdal.FileFromMemBuffer(path, buffer.getvalue())
     yield path
 
-    if os.path.exists(path):
-        os.remove(path)
+    gdal.Unlink(path)
+
+
+@pytest.fixture(scope="session")
+def standard_sum():
+    """Known-good `sum` output on the default grid"""
+    with gdal.Open("test/data/standard_output_sum.tif") as src:
+        return _read_only(src.ReadAsArray())
+
+
+@pytest.fixture(scope="session")
+def standard_sum_custom_shape():
+    """Known-good `sum` output on the custom SHAPE"""
+    with gdal.Open("test/data/standard_output_sum_custom_shape.tif") as src:
+        return _read_only(src.ReadAsArray())
+
+
+@pytest.fixture(scope="module")
+def gdal_reference(exploded_gpkg):
+    """GDAL rasterization of the exploded GPKG, computed once per set of grid arguments"""
+
+    @lru_cache
+    def _reference(res=None, shape=None, extent=None, all_touched=False):
+        kwargs = {}
+        if res is not None:
+            kwargs.update(xRes=res[0], yRes=res[1])
+        if shape is not None:
+            kwargs.update(width=shape[1], height=shape[0])
+        if extent is not None:
+            kwargs["outputBounds"] = list(extent)
+
+        # datasets are not thread-safe, so each reference opens its own
+        src_gdal = gdal.OpenEx(exploded_gpkg)
+        out_ds = gdal.Rasterize(
+            "",
+            src_gdal,
+            format="MEM",
+            outputType=gdal.GDT_Byte,
+            attribute="value",
+            layers=["test"],
+            allTouched=all_touched,
+            add=True,
+            **kwargs,
+        )
+        return _read_only(out_ds.ReadAsArray())
+
+    # GDAL releases the GIL while rasterizing, so the references used by the tests are computed concurrently up front
+    specs = [((1, 1) if shape is None else None, shape, extent, all_touched) for extent, shape, all_touched in CUSTOM_GRIDS]
+    specs.append(((0.5, 0.5), None, None, True))
+    with ThreadPoolExecutor() as executor:
+        # reading the results re-raises any failure from the workers
+        list(executor.map(lambda spec: _reference(*spec), specs))
+
+    return _reference
+
+
+# invalid argument -> (rusterize kwargs, expected TypeError message), compiled once at import
+TYPE_ERRORS = {
+    "data": ({"data": "not_a_dataframe", "res": (1, 1)}, re.compile("`data` must be either geopandas")),
+    "like": ({"like": "not_an_xarray", "res": (1, 1)}, re.compile("`like` must be a xarray.DataArray")),
+    "res": ({"res": "1x1"}, re.compile("`resolution` must be a tuple or list")),
+    "out_shape": ({"out_shape": "100x100"}, re.compile("`out_shape` must be a tuple or list")),
+    "extent": ({"extent": "0,0,10,10"}, re.compile("`extent` must be a tuple or list")),
+    "field": ({"field": 123}, re.compile("`field` must be a string")),
+    "by": ({"by": 123}, re.compile("`by` must be a string")),
+    "burn": ({"burn": "hot"}, re.compile("`burn` must be an integer, float")),
+    "fun": ({"fun": 1}, re.compile("`pixel_fn` must be one of")),
+    "background": ({"background": "black"}, re.compile("`background` must be integer, float, or None")),
+    "encoding": ({"encoding": 1}, re.compile("`encoding` must be one of 'xarray'")),
+    "all_touched": ({"all_touched": "yes"}, re.compile("`all_touched` must be a boolean")),
+    "tap": ({"tap": "yes"}, re.compile("`tap` must be a boolean")),
+    "dtype": ({"dtype": 64}, re.compile("`dtype` must be a one of")),
+}
 
 
 class TestTypeChecks:
-    @pytest.mark.parametrize(
-        "kwargs, expected_match",
-        [
-            ({"data": "not_a_dataframe", "res": (1, 1)}, "`data` must be either geopandas"),
-            ({"like": "not_an_xarray", "res": (1, 1)}, "`like` must be a xarray.DataArray"),
-            ({"res": "1x1"}, "`resolution` must be a tuple or list"),
-            ({"out_shape": "100x100"}, "`out_shape` must be a tuple or list"),
-            ({"extent": "0,0,10,10"}, "`extent` must be a tuple or list"),
-            ({"field": 123}, "`field` must be a string"),
-            ({"by": 123}, "`by` must be a string"),
-            ({"burn": "hot"}, "`burn` must be an integer, float"),
-            ({"fun": 1}, "`pixel_fn` must be one of"),
-            ({"background": "black"}, "`background` must be integer, float, or None"),
-            ({"encoding": 1}, "`encoding` must be one of 'xarray'"),
-            ({"all_touched": "yes"}, "`all_touched` must be a boolean"),
-            ({"tap": "yes"}, "`tap` must be a boolean"),
-            ({"dtype": 64}, "`dtype` must be a one of"),
-        ],
-    )
+    @pytest.mark.parametrize("kwargs, expected_match", list(TYPE_ERRORS.values()), ids=list(TYPE_ERRORS))
     def test_type_errors(self, kwargs, expected_match):
         args = {"data": GDF, "res": (1, 1)}
         args.update(kwargs)
@@ -73,10 +181,7 @@ class TestTypeChecks:
 
 class TestMissingDependencies:
     def test_geopandas_missing(self):
-        import geopandas as gpd
-        from shapely import wkt
-
-        gdf = gpd.GeoDataFrame(geometry=wkt.loads(GEOMS))
+        gdf = gpd.GeoDataFrame(geometry=geometries)
 
         with patch("rusterize._check_for_geopandas", return_value=False):
             with pytest.raises(TypeError, match="`data` must be either geopandas.GeoDataFrame"):
@@ -89,14 +194,15 @@ class TestMissingDependencies:
                 with pytest.raises(ModuleNotFoundError, match="polars must be installed when data is geopandas.GeoDataFrame."):
                     rusterize(GDF, res=(1, 1), by="value", encoding="numpy")
 
-    def test_polars_st_missing(self):
-        import polars_st as st
-
-        plst = st.GeoDataFrame({"geometry": GEOMS})
+    def test_polars_not_needed_without_by(self):
+        with patch("rusterize._polars_available", return_value=False):
+            rusterize(GDF, res=(1, 1), encoding="numpy")
+            rusterize(GDF, res=(1, 1), field="value", encoding="numpy")
 
+    def test_polars_st_missing(self):
         with patch("rusterize._check_for_polars_st", return_value=False):
             with pytest.raises(TypeError, match="`data` must be either geopandas.GeoDataFrame, geopandas.GeoSeries, polars.DataFrame"):
-                rusterize(plst, res=(1, 1), encoding="numpy")
+                rusterize(PLST, res=(1, 1), encoding="numpy")
 
     def test_xarray_encoding_missing(self):
         with patch("rusterize._xarray_available", return_value=False):
@@ -105,7 +211,6 @@ class TestMissingDependencies:
 
     def test_xarray_like_missing(self):
         with patch("rusterize._xarray_available", return_value=False):
-            import xarray as xr
             like = xr.DataArray()
 
             with pytest.raises(TypeError, match="`like` must be a xarray.DataArray or xarray.Dataset"):
@@ -114,15 +219,23 @@ class TestMissingDependencies:
 
 class TestArguments:
     def test_burn_parameter(self):
-        r = rusterize(GDF, res=(1, 1), burn=99, encoding="numpy").squeeze()
+        r = rusterize(GDF, res=(1, 1), burn=99, encoding="numpy")[0]
         assert np.nanmax(r) == 99
         assert np.nanmin(r[r > 0]) == 99
 
     def test_background_parameter(self):
         bg_value = -1
-        r = rusterize(GDF, res=(1, 1), burn=1, background=bg_value, encoding="numpy").squeeze()
+        r = rusterize(GDF, res=(1, 1), burn=1, background=bg_value, encoding="numpy")[0]
         assert r[0, 0] == bg_value
 
+    def test_invalid_pixel_fn_error(self):
+        with pytest.raises(ValueError, match="`pixel_fn` must be one of"):
+            rusterize(GDF, res=(1, 1), fun="mean")
+
+    def test_invalid_dtype_error(self):
+        with pytest.raises(ValueError, match="`dtype` must be a one of"):
+            rusterize(GDF, res=(1, 1), dtype="float16")
+
     def test_mutually_exclusive_field_burn(self):
         with pytest.raises(ValueError, match="Only one of `field` or `burn` can be specified"):
             rusterize(GDF, res=(1, 1), field="value", burn=5)
@@ -143,6 +256,8 @@ class TestArguments:
     def test_invalid_resolution_error(self):
         with pytest.raises(ValueError, match="`res` must be 2 positive numbers"):
             rusterize(GDF, res=(-1, 1))
+        with pytest.raises(ValueError, match="`res` must be 2 positive numbers"):
+            rusterize(GDF, res=())
 
     def test_invalid_shape_error(self):
         with pytest.raises(ValueError, match="`out_shape` must be 2 positive integers"):
@@ -157,10 +272,9 @@ class TestArguments:
         with pytest.raises(ValueError, match=re.escape(expected_msg)):
             rusterize(GDF, res=(1, 1), extent=(0, 0, 0, 0))
 
-    def test_mutually_exclusive_like(self):
-        like = rusterize(GDF, res=(1, 1), field="value", encoding="xarray")
+    def test_mutually_exclusive_like(self, like_xarr):
         with pytest.raises(ValueError, match="`like` is mutually exclusive with `res`, `out_shape`, and `extent`."):
-            rusterize(GDF, like=like, res=(1, 1))
+            rusterize(GDF, like=like_xarr, res=(1, 1))
 
 
 class TestFormats:
@@ -179,39 +293,55 @@ class TestFormats:
         r_numpy = rusterize(np.asarray(GEOMS), res=(1, 1), dtype="uint8", fun="sum", encoding="numpy")
 
         # list or numpy WKB
-        r_list_wkb = rusterize(GDF.to_wkb().geometry.tolist(), res=(1, 1), dtype="uint8", fun="sum", encoding="numpy")
-        r_numpy_wkb = rusterize(
-            np.asarray(GDF.to_wkb().geometry), res=(1, 1), dtype="uint8", fun="sum", encoding="numpy"
-        )
+        r_list_wkb = rusterize(WKB_LIST, res=(1, 1), dtype="uint8", fun="sum", encoding="numpy")
+        r_numpy_wkb = rusterize(WKB_NP, res=(1, 1), dtype="uint8", fun="sum", encoding="numpy")
+
+        # numpy WKB mixing bytes with other buffer types
+        wkb_mixed = np.array([WKB_LIST[0], *map(bytearray, WKB_LIST[1:])], dtype=object)
+        r_mixed_wkb = rusterize(wkb_mixed, res=(1, 1), dtype="uint8", fun="sum", encoding="numpy")
 
         # polars ST WKT
-        plst = st.GeoDataFrame({"value": list(range(1, len(GEOMS) + 1)), "geometry": GEOMS})
-        r_plst = rusterize(plst, res=(1, 1), dtype="uint8", fun="sum", encoding="numpy")
+        r_plst = rusterize(PLST, res=(1, 1), dtype="uint8", fun="sum", encoding="numpy")
 
         # polars ST WKB
-        plst_wkb = plst.st.to_wkb()
-        r_plst_wkb = rusterize(plst_wkb, res=(1, 1), dtype="uint8", fun="sum", encoding="numpy")
-
-        assert np.allclose(r_gpd, r_list)
-        assert np.allclose(r_gpd, r_list_geom)
-        assert np.allclose(r_gpd, r_gs)
-        assert np.allclose(r_gpd, r_numpy)
-        assert np.allclose(r_gpd, r_plst)
-        assert np.allclose(r_gpd, r_list_wkb)
-        assert np.allclose(r_gpd, r_numpy_wkb)
-        assert np.allclose(r_gpd, r_plst_wkb)
+        r_plst_wkb = rusterize(PLST_WKB, res=(1, 1), dtype="uint8", fun="sum", encoding="numpy")
+
+        assert np.array_equal(r_gpd, r_list)
+        assert np.array_equal(r_gpd, r_list_geom)
+        assert np.array_equal(r_gpd, r_gs)
+        assert np.array_equal(r_gpd, r_numpy)
+        assert np.array_equal(r_gpd, r_plst)
+        assert np.array_equal(r_gpd, r_list_wkb)
+        assert np.array_equal(r_gpd, r_numpy_wkb)
+        assert np.array_equal(r_gpd, r_mixed_wkb)
+        assert np.array_equal(r_gpd, r_plst_wkb)
+
+    @pytest.mark.parametrize("geoms", list(SINGLE_TYPE_GEOMS.values()), ids=list(SINGLE_TYPE_GEOMS))
+    def test_single_type_inputs(self, geoms):
+        shapes = [wkt.loads(geom) for geom in geoms]
+        r_wkb = rusterize(shapely.to_wkb(shapes).tolist(), res=(1, 1), dtype="uint8", fun="sum", encoding="numpy")
+        r_gs = rusterize(gpd.GeoSeries(shapes), res=(1, 1), dtype="uint8", fun="sum", encoding="numpy", burn=1)
+        r_list_geom = rusterize(shapes, res=(1, 1), dtype="uint8", fun="sum", encoding="numpy", burn=1)
+
+        # missing geometries are kept as empty geometries and burn nothing
+        with_missing = [shapes[0], None, *shapes[1:], None]
+        r_missing = rusterize(with_missing, res=(1, 1), dtype="uint8", fun="sum", encoding="numpy", burn=1)
+
+        assert np.array_equal(r_wkb, r_gs)
+        assert np.array_equal(r_wkb, r_list_geom)
+        assert np.array_equal(r_wkb, r_missing)
 
     def test_geoseries_burn_input(self):
         burn = np.arange(1, len(GEOMS) + 1)
         r_burn = rusterize(GEOMS, res=(1, 1), dtype="uint8", burn=burn, fun="sum", encoding="numpy")
         r_field = rusterize(GDF, res=(1, 1), dtype="uint8", field="value", fun="sum", encoding="numpy")
-        assert np.allclose(r_burn, r_field)
+        assert np.array_equal(r_burn, r_field)
 
     def test_burn_array(self):
         burn = np.arange(1, len(GEOMS) + 1)
         r_burn = rusterize(GDF, res=(1, 1), dtype="uint8", burn=burn, fun="sum", encoding="numpy")
         r_field = rusterize(GDF, res=(1, 1), dtype="uint8", field="value", fun="sum", encoding="numpy")
-        assert np.allclose(r_burn, r_field)
+        assert np.array_equal(r_burn, r_field)
 
     def test_outputs(self):
         r_numpy = rusterize(GDF, res=(1, 1), dtype="uint8", field="value", encoding="numpy")
@@ -219,220 +349,150 @@ class TestFormats:
         r_sparse1 = rusterize(GDF, res=(1, 1), dtype="uint8", field="value", encoding="sparse").to_numpy()
         r_sparse2 = rusterize(GDF, res=(1, 1), dtype="uint8", field="value", encoding="sparse").to_xarray()
 
-        assert np.allclose(r_numpy, r_xarray.data)
-        assert np.allclose(r_numpy, r_sparse1)
-        assert np.allclose(r_numpy, r_sparse2.data)
+        assert np.array_equal(r_numpy, r_xarray.data)
+        assert np.array_equal(r_numpy, r_sparse1)
+        assert np.array_equal(r_numpy, r_sparse2.data)
+
+        r_sparse = rusterize(GDF, res=(1, 1), dtype="uint8", field="value", encoding="sparse")
+        assert pl.DataFrame(r_sparse).equals(r_sparse.to_frame())
+
+    def test_batch(self):
+        extent = [-180, -70, 180, 60]
+        tiles = [GDF.iloc[:2], GDF.iloc[2:]]
+        r_batch = rusterize_batch(tiles, res=(1, 1), extent=extent, dtype="uint8", field="value", encoding="numpy")
+        r_single = [
+            rusterize(tile, res=(1, 1), extent=extent, dtype="uint8", field="value", encoding="numpy") for tile in tiles
+        ]
+
+        assert len(r_batch) == len(tiles)
+        for batch, single in zip(r_batch, r_single):
+            assert np.array_equal(batch, single)
+
+        # one burn array and one `out` per input
+        burns = [np.arange(1, len(tile) + 1, dtype="uint8") for tile in tiles]
+        outs = [np.full(single.shape, 255, dtype="uint8") for single in r_single]
+        r_burn = rusterize_batch(
+            tiles, res=(1, 1), extent=extent, dtype="uint8", burn=burns, encoding="numpy", out=outs
+        )
+        for batch, out, tile, b in zip(r_burn, outs, tiles, burns):
+            single = rusterize(tile, res=(1, 1), extent=extent, dtype="uint8", burn=b, encoding="numpy")
+            assert batch is out
+            assert np.array_equal(out, single)
 
+        with pytest.raises(ValueError, match="A fixed grid is required"):
+            rusterize_batch(tiles, res=(1, 1))
+        with pytest.raises(ValueError, match="one value per input"):
+            rusterize_batch(tiles, res=(1, 1), extent=extent, burn=burns[:1])
 
-class TestCoherence:
-    def test_standard(self):
-        # comparing against a known-good static file
-        r = rusterize(GDF, res=(1, 1), dtype="uint8", field="value", fun="sum", encoding="numpy").squeeze()
+    def test_out_array(self):
+        extent = [-180, -70, 180, 60]
+        expected = rusterize(GDF, res=(1, 1), extent=extent, dtype="uint8", field="value", encoding="numpy")
 
-        data_path = "test/data/standard_output_sum.tif"
-        with gdal.Open(data_path) as src:
-            gdal_array = src.ReadAsArray()
-            assert np.allclose(r, gdal_array)
+        # stale values are reset to background before burning
+        out = np.full(expected.shape, 255, dtype="uint8")
+        r = rusterize(GDF, res=(1, 1), extent=extent, dtype="uint8", field="value", encoding="numpy", out=out)
+        assert r is out
+        assert np.array_equal(out, expected)
 
-    def test_alltouched(self, exploded_gpkg):
-        src_gdal = gdal.OpenEx(exploded_gpkg)
-        out_ds = gdal.Rasterize(
-            "",
-            src_gdal,
-            format="MEM",
-            outputType=gdal.GDT_Byte,
-            xRes=0.5,
-            yRes=0.5,
-            attribute="value",
-            layers=["test"],
-            allTouched=True,
-            add=True,
-        )
+        # xarray outputs with a CRS wrap `out` without copying it
+        gdf_crs = GDF.set_crs(4326)
+        r_xarr = rusterize(gdf_crs, res=(1, 1), extent=extent, dtype="uint8", field="value", out=out)
+        assert r_xarr.rio.crs.to_epsg() == 4326
+        assert np.shares_memory(r_xarr.data, out)
+        assert np.array_equal(r_xarr.data, expected)
 
-        r = rusterize(
-            GDF.explode().explode(),
-            res=(0.5, 0.5),
-            dtype="uint8",
-            field="value",
-            fun="sum",
-            encoding="numpy",
-            all_touched=True,
-        ).squeeze()
+    def test_out_array_errors(self):
+        extent = [-180, -70, 180, 60]
+        out = np.zeros((1, 130, 360), dtype="uint8")
 
-        assert np.allclose(r, out_ds.ReadAsArray())
+        with pytest.raises(ValueError, match="same dtype"):
+            rusterize(GDF, res=(1, 1), extent=extent, dtype="float32", encoding="numpy", out=out)
 
+        with pytest.raises(TypeError, match="3D numpy.ndarray"):
+            rusterize(GDF, res=(1, 1), extent=extent, dtype="uint8", encoding="numpy", out=out[0])
 
-class TestCustomRaster:
-    def test_like(self):
-        like = rusterize(GDF, res=(1, 1), dtype="uint8", field="value", encoding="xarray")
-        r = rusterize(GDF, like=like, dtype="uint8", field="value", encoding="numpy").squeeze()
-        assert r.shape == like.squeeze().shape
+        with pytest.raises(ValueError, match="not supported when encoding is `sparse`"):
+            rusterize(GDF, res=(1, 1), extent=extent, dtype="uint8", encoding="sparse", out=out)
 
-    def test_extent_standard(self, exploded_gpkg):
-        extent = [-349, -507, 1, 0]
-        src_gdal = gdal.OpenEx(exploded_gpkg)
-        out_ds = gdal.Rasterize(
-            "",
-            src_gdal,
-            format="MEM",
-            outputType=gdal.GDT_Byte,
-            xRes=1,
-            yRes=1,
-            outputBounds=extent,
-            attribute="value",
-            layers=["test"],
-            add=True,
-        )
+        # wrong grid, then wrong number of bands for `by`
+        with pytest.raises(ValueError, match="Shape of `out`"):
+            rusterize(GDF, res=(2, 2), extent=extent, dtype="uint8", encoding="numpy", out=out)
+        with pytest.raises(ValueError, match="Shape of `out`"):
+            rusterize(GDF, res=(1, 1), extent=extent, dtype="uint8", by="value", encoding="numpy", out=out)
 
-        r = rusterize(
-            GDF.explode().explode(),
-            res=(1, 1),
-            dtype="uint8",
-            field="value",
-            extent=extent,
-            fun="sum",
-            encoding="numpy",
-        ).squeeze()
 
-        assert np.allclose(r, out_ds.ReadAsArray())
+class TestCoherence:
+    def test_standard(self, standard_sum):
+        # comparing against a known-good static file
+        r = rusterize(GDF, res=(1, 1), dtype="uint8", field="value", fun="sum", encoding="numpy")[0]
+        assert np.array_equal(r, standard_sum)
 
-    def test_extent_alltouched(self, exploded_gpkg):
-        extent = [-349, -507, 1, 0]
-        src_gdal = gdal.OpenEx(exploded_gpkg)
-        out_ds = gdal.Rasterize(
-            "",
-            src_gdal,
-            format="MEM",
-            outputType=gdal.GDT_Byte,
-            xRes=1,
-            yRes=1,
-            outputBounds=extent,
-            attribute="value",
-            layers=["test"],
-            allTouched=True,
-            add=True,
-        )
+    @pytest.mark.heavy
+    def test_alltouched(self, gdal_reference):
+        expected = gdal_reference((0.5, 0.5), None, None, True)
 
         r = rusterize(
-            GDF.explode().explode(),
-            res=(1, 1),
+            EXPLODED_GDF,
+            res=(0.5, 0.5),
             dtype="uint8",
             field="value",
-            extent=extent,
             fun="sum",
             encoding="numpy",
             all_touched=True,
-        ).squeeze()
+        )[0]
 
-        assert np.allclose(r, out_ds.ReadAsArray())
+        assert np.array_equal(r, expected)
 
-    def test_shape_standard(self, exploded_gpkg):
-        shape = (47, 319)  # (height, width)
 
-        # interestingly, GDAL cuts the end/start of the lines with this custom shape
-        data_path = "test/data/standard_output_sum_custom_shape.tif"
-        with gdal.Open(data_path) as src:
-            gdal_array = src.ReadAsArray()
-
-        r = rusterize(
-            GDF.explode().explode(),
+class TestCustomRaster:
+    def test_like(self, like_xarr):
+        r = rusterize(GDF, like=like_xarr, dtype="uint8", field="value", encoding="numpy")[0]
+        assert r.shape == like_xarr.shape[1:]
+        assert np.array_equal(r, like_xarr.data[0])
+
+    def test_like_tap(self, like_xarr):
+        # `tap` applies to the `like` grid exactly as to the equivalent user-defined shape + extent
+        r = rusterize(GDF, like=like_xarr, dtype="uint8", field="value", encoding="numpy", tap=True)
+        expected = rusterize(
+            GDF,
+            out_shape=like_xarr.shape[1:],
+            extent=like_xarr.rio.bounds(),
             dtype="uint8",
             field="value",
-            out_shape=shape,
-            fun="sum",
             encoding="numpy",
-        ).squeeze()
-
-        assert np.allclose(r, gdal_array)
-
-    def test_shape_alltouched(self, exploded_gpkg):
-        shape = (47, 319)  # (height, width)
-        src_gdal = gdal.OpenEx(exploded_gpkg)
-        out_ds = gdal.Rasterize(
-            "",
-            src_gdal,
-            format="MEM",
-            outputType=gdal.GDT_Byte,
-            width=shape[1],
-            height=shape[0],
-            attribute="value",
-            layers=["test"],
-            allTouched=True,
-            add=True,
+            tap=True,
         )
+        assert np.array_equal(r, expected)
 
-        r = rusterize(
-            GDF.explode().explode(),
-            dtype="uint8",
-            field="value",
-            out_shape=shape,
-            fun="sum",
-            encoding="numpy",
-            all_touched=True,
-        ).squeeze()
-
-        assert np.allclose(r, out_ds.ReadAsArray())
-
-    def test_some_user_inputs_standard(self, exploded_gpkg):
-        # GDAL doesn't directly support res + shape as input parameters here
-        extent = [-349, -507, 1, 0]
-        shape = (47, 319)
-
-        src_gdal = gdal.OpenEx(exploded_gpkg)
-        out_ds = gdal.Rasterize(
-            "",
-            src_gdal,
-            format="MEM",
-            outputType=gdal.GDT_Byte,
-            width=shape[1],
-            height=shape[0],
-            outputBounds=extent,
-            attribute="value",
-            layers=["test"],
-            add=True,
-        )
+    @pytest.mark.heavy
+    @pytest.mark.parametrize("extent, shape, all_touched", CUSTOM_GRIDS)
+    def test_against_gdal(self, gdal_reference, extent, shape, all_touched):
+        res = (1, 1) if shape is None else None
+        expected = gdal_reference(res, shape, extent, all_touched)
 
         r = rusterize(
-            GDF.explode().explode(),
-            dtype="uint8",
-            field="value",
+            EXPLODED_GDF,
+            res=res,
             out_shape=shape,
             extent=extent,
+            dtype="uint8",
+            field="value",
             fun="sum",
             encoding="numpy",
-        ).squeeze()
-
-        assert np.allclose(r, out_ds.ReadAsArray())
+            all_touched=all_touched,
+        )[0]
 
-    def test_some_user_inputs_alltouched(self, exploded_gpkg):
-        # GDAL doesn't directly support res + shape as input parameters here
-        extent = [-349, -507, 1, 0]
-        shape = (47, 319)
-
-        src_gdal = gdal.OpenEx(exploded_gpkg)
-        out_ds = gdal.Rasterize(
-            "",
-            src_gdal,
-            format="MEM",
-            outputType=gdal.GDT_Byte,
-            width=shape[1],
-            height=shape[0],
-            outputBounds=extent,
-            attribute="value",
-            layers=["test"],
-            allTouched=True,
-            add=True,
-        )
+        assert np.array_equal(r, expected)
 
+    def test_shape_standard(self, standard_sum_custom_shape):
+        # interestingly, GDAL cuts the end/start of the lines with this custom shape
         r = rusterize(
-            GDF.explode().explode(),
+            EXPLODED_GDF,
             dtype="uint8",
             field="value",
-            out_shape=shape,
-            extent=extent,
+            out_shape=SHAPE,
             fun="sum",
             encoding="numpy",
-            all_touched=True,
-        ).squeeze()
+        )[0]
 
-        assert np.allclose(r, out_ds.ReadAsArray())
+        assert np.array_equal(r, standard_sum_custom_shape)
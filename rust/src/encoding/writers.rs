@@ -1,7 +1,10 @@
 use crate::{
     encoding::arrays::SparseArray,
     prelude::{RasterDtype, RasterizeContext},
-    rasterization::{pixel_cache::PixelCache, pixel_functions::PixelFn},
+    rasterization::{
+        pixel_cache::PixelCache,
+        pixel_functions::{PixelFn, SpanFn},
+    },
 };
 use ndarray::ArrayViewMut2;
 use num_traits::Num;
@@ -9,6 +12,16 @@ use num_traits::Num;
 /// Trait in charge of writing a pixel onto a [`DenseArray`] or [`SparseArray`].
 pub(crate) trait PixelWriter<N: Num> {
     fn write(&mut self, y: usize, x: usize, value: N, background: N);
+
+    /// Write `value` to pixels `xstart..xend` of row `y`.
+    fn write_span(&mut self, y: usize, xstart: usize, xend: usize, value: N, background: N)
+    where
+        N: Copy,
+    {
+        for x in xstart..xend {
+            self.write(y, x, value, background);
+        }
+    }
 }
 
 /// Writer for interior and exterior [`geo::Linestring`] when `all_touched` is true (pass 1).
@@ -63,17 +76,33 @@ impl<'a, W> FillWriter<'a, W> {
 pub struct DenseArrayWriter<'a, N> {
     band: ArrayViewMut2<'a, N>,
     pxfn: PixelFn<N>,
+    spanfn: SpanFn<N>,
 }
 
 impl<'a, N: Num> PixelWriter<N> for DenseArrayWriter<'a, N> {
     fn write(&mut self, y: usize, x: usize, value: N, background: N) {
         (self.pxfn)(&mut self.band, y, x, value, background);
     }
+
+    fn write_span(&mut self, y: usize, xstart: usize, xend: usize, value: N, background: N)
+    where
+        N: Copy,
+    {
+        // rows of a standard-layout band are contiguous
+        if let Some(row) = self.band.row_mut(y).into_slice() {
+            (self.spanfn)(&mut row[xstart..xend], value, background);
+            return;
+        }
+
+        for x in xstart..xend {
+            (self.pxfn)(&mut self.band, y, x, value, background);
+        }
+    }
 }
 
 impl<'a, N: Num> DenseArrayWriter<'a, N> {
-    pub fn new(band: ArrayViewMut2<'a, N>, pxfn: PixelFn<N>) -> Self {
-        Self { band, pxfn }
+    pub fn new(band: ArrayViewMut2<'a, N>, pxfn: PixelFn<N>, spanfn: SpanFn<N>) -> Self {
+        Self { band, pxfn, spanfn }
     }
 }
 
@@ -96,6 +125,16 @@ impl<N: Num> PixelWriter<N> for SparseArrayWriter<N> {
         self.cols.push(x as u64);
         self.values.push(value);
     }
+
+    fn write_span(&mut self, y: usize, xstart: usize, xend: usize, value: N, _background: N)
+    where
+        N: Copy,
+    {
+        let n = xend.saturating_sub(xstart);
+        self.rows.extend(std::iter::repeat_n(y as u64, n));
+        self.cols.extend((xstart..xend).map(|x| x as u64));
+        self.values.extend(std::iter::repeat_n(value, n));
+    }
 }
 
 impl<N> ToSparseArray<N> for SparseArrayWriter<N>
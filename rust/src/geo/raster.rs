@@ -26,6 +26,20 @@ impl RasterInfo {
     {
         Array3::from_elem((bands, self.nrows, self.ncols), background)
     }
+
+    /// Whether a geometry with bounding box `bounds` cannot burn any pixel, i.e. it is empty or lies
+    /// entirely outside the raster. Checked before building edges, which is the costly part.
+    pub(crate) fn misses(&self, bounds: Option<Rect>) -> bool {
+        match bounds {
+            None => true,
+            Some(rect) => {
+                rect.max().x < self.xmin
+                    || rect.min().x > self.xmax
+                    || rect.max().y < self.ymin
+                    || rect.min().y > self.ymax
+            }
+        }
+    }
 }
 
 /// Builder for a [`RasterInfo`] instance.
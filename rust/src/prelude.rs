@@ -1,4 +1,4 @@
-use crate::rasterization::pixel_functions::PixelFn;
+use crate::rasterization::pixel_functions::{PixelFn, SpanFn};
 use num_traits::Num;
 use std::ops::AddAssign;
 
@@ -113,6 +113,13 @@ impl<'a, N> RasterizeContext<'a, N> {
         self.pixel_fn.to_function()
     }
 
+    pub(crate) fn span_fn(&self) -> SpanFn<N>
+    where
+        N: Num + Copy + AddAssign + PartialOrd + NaNAware,
+    {
+        self.pixel_fn.to_span_function()
+    }
+
     pub(crate) fn requires_dedup(&self) -> bool {
         self.all_touched && matches!(self.pixel_fn, PixelFunction::Sum | PixelFunction::Count)
     }
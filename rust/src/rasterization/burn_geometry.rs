@@ -9,6 +9,7 @@ use crate::{
         pixel_cache::PixelCache,
     },
 };
+use geo::BoundingRect;
 use geo_types::{Geometry, GeometryCollection, LineString, MultiLineString, MultiPolygon, Polygon};
 use num_traits::Num;
 
@@ -79,6 +80,11 @@ where
     W: PixelWriter<N>,
 {
     fn burn<S: LineBurnStrategy>(&self, raster_info: &RasterInfo, field_value: N, writer: &mut W, background: N) {
+        // skip edge setup for geometries outside the raster
+        if raster_info.misses(self.bounding_rect()) {
+            return;
+        }
+
         // extract edges
         let mut polyedges = Vec::new();
         extract_ring(&mut polyedges, self.exterior(), raster_info);
@@ -123,6 +129,10 @@ where
     W: PixelWriter<N>,
 {
     fn burn<S: LineBurnStrategy>(&self, raster_info: &RasterInfo, field_value: N, writer: &mut W, background: N) {
+        if raster_info.misses(self.bounding_rect()) {
+            return;
+        }
+
         // extract edges for all polygon
         let mut polyedges = Vec::new();
         for polygon in self {
@@ -171,6 +181,10 @@ where
     W: PixelWriter<N>,
 {
     fn burn<S: LineBurnStrategy>(&self, raster_info: &RasterInfo, field_value: N, writer: &mut W, background: N) {
+        if raster_info.misses(self.bounding_rect()) {
+            return;
+        }
+
         // extract exterior and interior lines
         let mut linedges = Vec::new();
         extract_line(&mut linedges, self, raster_info);
@@ -192,6 +206,10 @@ where
     W: PixelWriter<N>,
 {
     fn burn<S: LineBurnStrategy>(&self, raster_info: &RasterInfo, field_value: N, writer: &mut W, background: N) {
+        if raster_info.misses(self.bounding_rect()) {
+            return;
+        }
+
         // extract all edges first to avoid overlaps when a line ends at the beginning of another
         let mut linedges = Vec::new();
         for line in self {
@@ -331,6 +349,18 @@ mod tests {
         assert!(cells.len() > 4, "square polygon should fill several cells");
     }
 
+    #[test]
+    fn geometry_outside_raster_burns_nothing() {
+        let poly = Polygon::new(
+            LineString::from(vec![(12.0, 2.0), (16.0, 2.0), (16.0, 6.0), (12.0, 6.0), (12.0, 2.0)]),
+            vec![],
+        );
+        assert!(burn(Geometry::Polygon(poly)).is_empty());
+
+        let ls = LineString::from(vec![(1.0, -5.0), (6.0, -5.0)]);
+        assert!(burn(Geometry::LineString(ls)).is_empty());
+    }
+
     #[test]
     fn multipolygon_fills_both() {
         let p = |x: f64, y: f64| {
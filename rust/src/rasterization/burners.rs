@@ -310,8 +310,8 @@ pub(super) fn burn_polygon<N, W>(
             let xstart = (x1 + 0.5).floor().clamp(0.0, ncols) as usize;
             let xend = (x2 + 0.5).floor().clamp(0.0, ncols) as usize;
 
-            for xpix in xstart..xend {
-                writer.write(yline, xpix, field_value, background);
+            if xstart < xend {
+                writer.write_span(yline, xstart, xend, field_value, background);
             }
         }
 
@@ -38,13 +38,28 @@ impl PixelFunction {
         N: Num + Copy + AddAssign + PartialOrd + NaNAware,
     {
         match self {
-            Self::Sum => sum_values,
-            Self::First => first_values,
-            Self::Last => last_values,
-            Self::Min => min_values,
-            Self::Max => max_values,
-            Self::Count => count_values,
-            Self::Any => any_values,
+            Self::Sum => pixel::<N, SumValues>,
+            Self::First => pixel::<N, FirstValues>,
+            Self::Last => pixel::<N, LastValues>,
+            Self::Min => pixel::<N, MinValues>,
+            Self::Max => pixel::<N, MaxValues>,
+            Self::Count => pixel::<N, CountValues>,
+            Self::Any => pixel::<N, AnyValues>,
+        }
+    }
+
+    pub(crate) fn to_span_function<N>(&self) -> SpanFn<N>
+    where
+        N: Num + Copy + AddAssign + PartialOrd + NaNAware,
+    {
+        match self {
+            Self::Sum => span::<N, SumValues>,
+            Self::First => span::<N, FirstValues>,
+            Self::Last => span::<N, LastValues>,
+            Self::Min => span::<N, MinValues>,
+            Self::Max => span::<N, MaxValues>,
+            Self::Count => span::<N, CountValues>,
+            Self::Any => span::<N, AnyValues>,
         }
     }
 }
@@ -52,72 +67,130 @@ impl PixelFunction {
 /// On-demand function for overlapping pixels.
 pub(crate) type PixelFn<N> = fn(&mut ArrayViewMut2<N>, usize, usize, N, N);
 
+/// Same as [`PixelFn`], applied to a contiguous run of pixels of one row.
+/// Operating on a slice lets the compiler vectorize the fill instead of indexing pixel by pixel.
+pub(crate) type SpanFn<N> = fn(&mut [N], N, N);
+
+/// How a new value is combined with the current one of a pixel.
+/// Each [`PixelFunction`] is defined once here, then used by both [`PixelFn`] and [`SpanFn`].
+trait Combine<N> {
+    fn combine(px: &mut N, value: N, bg: N);
+}
+
+fn pixel<N, C: Combine<N>>(array: &mut ArrayViewMut2<N>, y: usize, x: usize, value: N, bg: N) {
+    C::combine(&mut array[[y, x]], value, bg);
+}
+
+fn span<N, C: Combine<N>>(span: &mut [N], value: N, bg: N)
+where
+    N: Copy,
+{
+    for px in span {
+        C::combine(px, value, bg);
+    }
+}
+
 /// Sum values or NaN/background.
-fn sum_values<N>(array: &mut ArrayViewMut2<N>, y: usize, x: usize, value: N, bg: N)
+struct SumValues;
+
+impl<N> Combine<N> for SumValues
 where
     N: Num + AddAssign + NaNAware + Copy,
 {
-    if array[[y, x]] == bg || array[[y, x]].is_nan() || value.is_nan() {
-        array[[y, x]] = value;
-    } else {
-        array[[y, x]] += value;
+    #[inline(always)]
+    fn combine(px: &mut N, value: N, bg: N) {
+        if *px == bg || px.is_nan() || value.is_nan() {
+            *px = value;
+        } else {
+            *px += value;
+        }
     }
 }
 
 /// Set first value only if currently NaN/background.
-fn first_values<N>(array: &mut ArrayViewMut2<N>, y: usize, x: usize, value: N, bg: N)
+struct FirstValues;
+
+impl<N> Combine<N> for FirstValues
 where
     N: Num + NaNAware + Copy,
 {
-    if array[[y, x]] == bg || array[[y, x]].is_nan() {
-        array[[y, x]] = value;
+    #[inline(always)]
+    fn combine(px: &mut N, value: N, bg: N) {
+        if *px == bg || px.is_nan() {
+            *px = value;
+        }
     }
 }
 
 /// Always set last value.
-fn last_values<N>(array: &mut ArrayViewMut2<N>, y: usize, x: usize, value: N, _bg: N)
+struct LastValues;
+
+impl<N> Combine<N> for LastValues
 where
     N: Num + Copy,
 {
-    array[[y, x]] = value;
+    #[inline(always)]
+    fn combine(px: &mut N, value: N, _bg: N) {
+        *px = value;
+    }
 }
 
 /// Set value if smaller than current.
-fn min_values<N>(array: &mut ArrayViewMut2<N>, y: usize, x: usize, value: N, bg: N)
+struct MinValues;
+
+impl<N> Combine<N> for MinValues
 where
     N: Num + NaNAware + PartialOrd + Copy,
 {
-    if array[[y, x]] == bg || array[[y, x]].is_nan() || array[[y, x]] > value {
-        array[[y, x]] = value;
+    #[inline(always)]
+    fn combine(px: &mut N, value: N, bg: N) {
+        if *px == bg || px.is_nan() || *px > value {
+            *px = value;
+        }
     }
 }
 
 /// Set value if larger than current.
-fn max_values<N>(array: &mut ArrayViewMut2<N>, y: usize, x: usize, value: N, bg: N)
+struct MaxValues;
+
+impl<N> Combine<N> for MaxValues
 where
     N: Num + NaNAware + PartialOrd + Copy,
 {
-    if array[[y, x]] == bg || array[[y, x]].is_nan() || array[[y, x]] < value {
-        array[[y, x]] = value;
+    #[inline(always)]
+    fn combine(px: &mut N, value: N, bg: N) {
+        if *px == bg || px.is_nan() || *px < value {
+            *px = value;
+        }
     }
 }
 
 /// Count values at position.
-fn count_values<N>(array: &mut ArrayViewMut2<N>, y: usize, x: usize, _value: N, bg: N)
+struct CountValues;
+
+impl<N> Combine<N> for CountValues
 where
     N: Num + AddAssign + NaNAware + Copy,
 {
-    if array[[y, x]] == bg || array[[y, x]].is_nan() {
-        array[[y, x]] = N::one();
-    } else {
-        array[[y, x]] += N::one();
+    #[inline(always)]
+    fn combine(px: &mut N, _value: N, bg: N) {
+        if *px == bg || px.is_nan() {
+            *px = N::one();
+        } else {
+            *px += N::one();
+        }
     }
 }
 
 /// Mark presence.
-fn any_values<N>(array: &mut ArrayViewMut2<N>, y: usize, x: usize, _value: N, _bg: N)
+struct AnyValues;
+
+impl<N> Combine<N> for AnyValues
 where
     N: Num,
 {
-    array[[y, x]] = N::one();
+    #[inline(always)]
+    fn combine(px: &mut N, _value: N, _bg: N) {
+        *px = N::one();
+    }
 }
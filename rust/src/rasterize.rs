@@ -13,7 +13,7 @@ use crate::{
     },
 };
 use geo::Geometry;
-use ndarray::{ArrayView1, Axis};
+use ndarray::{ArrayView1, ArrayViewMut3, Axis};
 use rayon::iter::{IndexedParallelIterator, IntoParallelIterator, ParallelIterator};
 
 #[cfg(feature = "polars")]
@@ -53,12 +53,41 @@ macro_rules! dispatch {
 /// and produces a [`DenseArray`] or a [`SparseArray`].
 pub trait Rasterize {
     fn rasterize<A: ArrayBuilder>(&self, ctx: RasterizeContext<A::Dtype>) -> RusterizeResult<A>;
+
+    /// Burn onto a caller-provided dense array instead of allocating a new one, so that tiled workflows
+    /// can reuse a single buffer. `out` is reset to the background first and must be shaped
+    /// (bands, nrows, ncols). Returns the band names.
+    fn rasterize_into<N: RasterDtype>(
+        &self,
+        ctx: RasterizeContext<N>,
+        out: ArrayViewMut3<N>,
+    ) -> RusterizeResult<Vec<String>>;
 }
 
 impl<T: AsRef<[Geometry<f64>]> + ?Sized> Rasterize for T {
     fn rasterize<A: ArrayBuilder>(&self, ctx: RasterizeContext<A::Dtype>) -> RusterizeResult<A> {
         A::build(self.as_ref(), ctx)
     }
+
+    fn rasterize_into<N: RasterDtype>(
+        &self,
+        ctx: RasterizeContext<N>,
+        mut out: ArrayViewMut3<N>,
+    ) -> RusterizeResult<Vec<String>> {
+        let geoms = self.as_ref();
+        assert_matching_len(geoms.len(), &ctx.field, ctx.by)?;
+
+        let groups = ctx.by.map(group_keys);
+        let n_bands = groups.as_ref().map_or(1, |(names, _)| names.len());
+        if out.dim() != (n_bands, ctx.raster_info.nrows, ctx.raster_info.ncols) {
+            return Err(RusterizeError::ValueError(
+                "Shape of `out` does not match the (bands, rows, cols) of the output raster.",
+            ));
+        }
+
+        out.fill(ctx.background);
+        Ok(burn_dense(geoms, &ctx, out, groups))
+    }
 }
 
 /// [`DenseArray`] or [`SparseArray`] creation trait.
@@ -77,41 +106,12 @@ where
     fn build(geoms: &[Geometry<f64>], ctx: RasterizeContext<Self::Dtype>) -> RusterizeResult<Self> {
         assert_matching_len(geoms.len(), &ctx.field, ctx.by)?;
 
-        let dedup = ctx.requires_dedup();
-
-        match ctx.by {
-            Some(by) => {
-                let (groups, groups_idx) = group_keys(by);
-                let n_groups = groups.len();
-                let mut band_names = Vec::with_capacity(n_groups);
-                let mut raster = ctx.raster_info.build_raster(n_groups, ctx.background);
-
-                raster
-                    .outer_iter_mut()
-                    .into_par_iter()
-                    .zip(groups.into_par_iter())
-                    .zip(groups_idx.into_par_iter())
-                    .map(|((band, name), idxs)| {
-                        let mut writer = DenseArrayWriter::new(band, ctx.pixel_fn());
+        let groups = ctx.by.map(group_keys);
+        let n_bands = groups.as_ref().map_or(1, |(names, _)| names.len());
+        let mut raster = ctx.raster_info.build_raster(n_bands, ctx.background);
+        let band_names = burn_dense(geoms, &ctx, raster.view_mut(), groups);
 
-                        dispatch!(ctx.all_touched, dedup, geoms, &ctx, &mut writer, idxs.iter().copied());
-
-                        name
-                    })
-                    .collect_into_vec(&mut band_names);
-
-                Ok(DenseArray::new(raster, band_names, ctx.raster_info))
-            }
-            None => {
-                let band_names = vec![String::from("band_1")];
-                let mut raster = ctx.raster_info.build_raster(1, ctx.background);
-                let mut writer = DenseArrayWriter::new(raster.index_axis_mut(Axis(0), 0), ctx.pixel_fn());
-
-                dispatch!(ctx.all_touched, dedup, geoms, &ctx, &mut writer, 0..geoms.len());
-
-                Ok(DenseArray::new(raster, band_names, ctx.raster_info))
-            }
-        }
+        Ok(DenseArray::new(raster, band_names, ctx.raster_info))
     }
 }
 
@@ -156,6 +156,45 @@ where
     }
 }
 
+/// Burn onto a background-filled dense `raster`, one band per group if `groups` is provided.
+fn burn_dense<N: RasterDtype>(
+    geoms: &[Geometry<f64>],
+    ctx: &RasterizeContext<N>,
+    mut raster: ArrayViewMut3<N>,
+    groups: Option<(Vec<String>, Vec<Vec<usize>>)>,
+) -> Vec<String> {
+    let dedup = ctx.requires_dedup();
+
+    match groups {
+        Some((groups, groups_idx)) => {
+            let mut band_names = Vec::with_capacity(groups.len());
+
+            raster
+                .outer_iter_mut()
+                .into_par_iter()
+                .zip(groups.into_par_iter())
+                .zip(groups_idx.into_par_iter())
+                .map(|((band, name), idxs)| {
+                    let mut writer = DenseArrayWriter::new(band, ctx.pixel_fn(), ctx.span_fn());
+
+                    dispatch!(ctx.all_touched, dedup, geoms, ctx, &mut writer, idxs.iter().copied());
+
+                    name
+                })
+                .collect_into_vec(&mut band_names);
+
+            band_names
+        }
+        None => {
+            let mut writer = DenseArrayWriter::new(raster.index_axis_mut(Axis(0), 0), ctx.pixel_fn(), ctx.span_fn());
+
+            dispatch!(ctx.all_touched, dedup, geoms, ctx, &mut writer, 0..geoms.len());
+
+            vec![String::from("band_1")]
+        }
+    }
+}
+
 /// Burn the geometries at `indices` onto `writer`.
 /// `indices` is `0..len` for a single band, or the group's geometry indexes for multiband.
 #[cfg_attr(feature = "hotpath", hotpath::measure)]
@@ -273,6 +312,61 @@ mod tests {
         );
     }
 
+    #[test]
+    fn dense_sums_overlapping_polygons() {
+        let square = |x0: f64, x1: f64| {
+            Geometry::Polygon(Polygon::new(
+                LineString::from(vec![(x0, 0.5), (x1, 0.5), (x1, 3.5), (x0, 3.5), (x0, 0.5)]),
+                vec![],
+            ))
+        };
+        let geoms = vec![square(0.0, 3.0), square(1.0, 4.0)];
+        let ctx = RasterizeContext {
+            raster_info: raster_4x4(),
+            field: FieldSource::Scalar(1.0_f64),
+            by: None,
+            pixel_fn: PixelFunction::Sum,
+            background: 0.0,
+            all_touched: false,
+        };
+
+        let out: DenseArray<f64> = geoms.rasterize(ctx).unwrap();
+        let (raster, _, _) = out.into_parts();
+        let row = raster.slice(ndarray::s![0, 1, ..]);
+        assert_eq!(row.to_vec(), vec![1.0, 2.0, 2.0, 1.0]);
+    }
+
+    #[test]
+    fn rasterize_into_reuses_buffer() {
+        let square = |x0: f64, x1: f64| {
+            Geometry::Polygon(Polygon::new(
+                LineString::from(vec![(x0, 0.5), (x1, 0.5), (x1, 3.5), (x0, 3.5), (x0, 0.5)]),
+                vec![],
+            ))
+        };
+        let ctx = RasterizeContext {
+            raster_info: raster_4x4(),
+            field: FieldSource::Scalar(1.0_f64),
+            by: None,
+            pixel_fn: PixelFunction::Sum,
+            background: 0.0,
+            all_touched: false,
+        };
+
+        let geoms = vec![square(0.0, 3.0)];
+
+        // stale values from a previous tile must be reset to background
+        let mut out = ndarray::Array3::from_elem((1, 4, 4), 9.0_f64);
+        let names = geoms.rasterize_into(ctx.clone(), out.view_mut()).unwrap();
+        assert_eq!(names, vec![String::from("band_1")]);
+
+        let expected: DenseArray<f64> = geoms.rasterize(ctx.clone()).unwrap();
+        assert_eq!(&out, expected.array());
+
+        let mut wrong = ndarray::Array3::from_elem((2, 4, 4), 0.0_f64);
+        assert!(geoms.rasterize_into(ctx, wrong.view_mut()).is_err());
+    }
+
     #[test]
     fn multiband_burns_only_its_group() {
         use geo::Point;